@@ -162,6 +162,10 @@ def apply_binary_erosion(img: NDArray, footprint: FootprintShape) -> NDArray:
         footprint (FootprintShape): Structuring element.
 
     Returns:
-        NDArray: Eroded image.
+        NDArray: Eroded image (boolean array).
     """
+    # skimage's binary path copies non-bool inputs with astype; 0/1
+    # uint8 masks share the bool byte layout, so reinterpret for free.
+    if img.dtype == np.uint8:
+        img = img.view(bool)
     return morphology.binary_erosion(img, footprint.get_shape())
@@ -1,5 +1,3 @@
-import numpy as np
-
 from abc import ABC, abstractmethod
 from numpy.typing import NDArray
 from tifffile import TiffFile
@@ -95,15 +93,23 @@ class TiffReader(MultiChReader):
             PycrogliaException(1004): If the channel of interest is out of range.
         """
         self.validate_channels(ch, ch_interest)
-        data = []
 
         with TiffFile(str(self.path)) as tiff_file:
             number_of_images = len(tiff_file.pages)
 
-            for i in range(ch_interest - 1, number_of_images, ch):
-                data.append(tiff_file.pages[i].asarray())
+            # Memory-mapped output: contiguous uncompressed data is
+            # mapped in place and other layouts spill to a temporary
+            # file, so pages fault in as filters touch them instead of
+            # being decoded up front.
+            img = tiff_file.asarray(
+                key=range(ch_interest - 1, number_of_images, ch), out="memmap"
+            )
+
+        # A single selected page comes back 2D; callers expect (z, y, x)
+        if img.ndim == 2:
+            img = img.reshape((1, *img.shape))
 
-        return np.stack(data, axis=0)
+        return img
 
 
 class LsmReader(MultiChReader):
@@ -176,15 +182,21 @@ class LsmReader(MultiChReader):
             PycrogliaException(1004): If the channel of interest is out of range.
         """
         self.validate_channels(ch, ch_interest)
-        data = []
 
         with TiffFile(str(self.path)) as lsm_file:
             number_of_images = len(lsm_file.pages)
 
-            for i in range(ch_interest - 1, number_of_images, ch):
-                data.append(lsm_file.pages[i].asarray())
+            # See TiffReader.read: memory-mapped output defers page
+            # decoding until the data is actually touched.
+            img = lsm_file.asarray(
+                key=range(ch_interest - 1, number_of_images, ch), out="memmap"
+            )
+
+        # A single selected page comes back 2D; callers expect (z, y, x)
+        if img.ndim == 2:
+            img = img.reshape((1, *img.shape))
 
-        return np.stack(data, axis=0)
+        return img
 
 
 def create_channeled_reader(path: str) -> MultiChReader:
@@ -1,12 +1,68 @@
-import cv2
 import skimage
 import numpy as np
 
+from typing import Optional
+
 from numpy.typing import NDArray
 
 from pycroglia.core.enums import SkimageCellConnectivity
 
 
+def calculate_otsu_levels(img: NDArray) -> NDArray:
+    """Calculates the Otsu threshold level for each slice of a 3D image.
+
+    All slice histograms are built with a single bincount and the
+    between-class variance is evaluated with cumulative sums, avoiding a
+    Python-level loop over slices.
+
+    Args:
+        img (NDArray): 3D image array with shape (zs, height, width), where zs is the number of slices.
+
+    Returns:
+        NDArray: Per-slice threshold levels as a 1D float array of length zs.
+    """
+    img8 = img.astype(np.uint8, copy=False)
+    zs = img8.shape[0]
+
+    # One histogram per slice, computed in a single pass by offsetting
+    # each slice's values into its own 256-bin range.
+    offsets = np.arange(zs, dtype=np.int64)[:, None] * 256
+    indexes = img8.reshape(zs, -1).astype(np.int64) + offsets
+    hist = np.bincount(indexes.ravel(), minlength=zs * 256).reshape(zs, 256)
+    hist = hist.astype(np.float64)
+
+    p = hist / hist.sum(axis=1, keepdims=True)
+    w0 = np.cumsum(p, axis=1)
+    w1 = 1.0 - w0
+    mu = np.cumsum(np.arange(256) * p, axis=1)
+    mu_t = mu[:, -1:]
+
+    # Between-class variance; levels where one class is empty are invalid.
+    valid = (w0 > 0) & (w1 > 0)
+    sigma2 = np.zeros_like(w0)
+    np.divide((mu_t * w0 - mu) ** 2, w0 * w1, out=sigma2, where=valid)
+
+    return np.argmax(sigma2, axis=1).astype(np.float64)
+
+
+def apply_threshold_levels(img: NDArray, levels: NDArray, adjust: float) -> NDArray:
+    """Applies per-slice threshold levels with an adjustment factor to a 3D image.
+
+    Args:
+        img (NDArray): 3D image array with shape (zs, height, width).
+        levels (NDArray): Per-slice threshold levels, as returned by calculate_otsu_levels.
+        adjust (float): Adjustment factor to modify the threshold levels.
+
+    Returns:
+        NDArray: Binary 3D array (same shape as input) representing the thresholded mask.
+    """
+    img8 = img.astype(np.uint8, copy=False)
+    adjusted_levels = np.minimum(255.0, levels * adjust)
+    # The comparison already yields one 0/1 byte per voxel; viewing it
+    # as uint8 avoids a full-volume conversion copy.
+    return (img8 > adjusted_levels[:, None, None]).view(np.uint8)
+
+
 def calculate_otsu_threshold(img: NDArray, adjust: float) -> NDArray:
     """Calculates a binary mask for each slice of a 3D image using Otsu's method and a threshold adjustment factor.
 
@@ -17,22 +73,69 @@ def calculate_otsu_threshold(img: NDArray, adjust: float) -> NDArray:
     Returns:
         NDArray: Boolean 3D array (same shape as input) representing the binary thresholded mask.
     """
-    zs, height, width = img.shape
-    binary_stack = np.zeros((zs, height, width), dtype=np.uint8)
+    levels = calculate_otsu_levels(img)
+    return apply_threshold_levels(img, levels, adjust)
+
+
+def label_image_components(
+    img: NDArray,
+    connectivity: SkimageCellConnectivity = SkimageCellConnectivity.EDGES,
+) -> tuple[NDArray, NDArray]:
+    """Labels connected components of a 3D binary mask and computes their sizes.
 
-    for i in range(zs):
-        z_slice = img[i, :, :].astype(np.uint8)
-        # Otsu method for obtaining the threshold
-        level, _ = cv2.threshold(z_slice, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        adjusted_level = min(255.0, level * adjust)
+    Args:
+        img (NDArray): 3D binary array (dtype=bool or uint8) with shape (zs, height, width).
+        connectivity (SkimageCellConnectivity): Connectivity used by skimage. Defaults to SkimageCellConnectivity.EDGES.
 
-        # Apply the adjusted level
-        _, obtained_slice = cv2.threshold(
-            z_slice, adjusted_level, 255, cv2.THRESH_BINARY
-        )
-        binary_stack[i, :, :] = obtained_slice > 0
+    Returns:
+        tuple[NDArray, NDArray]: Labeled 3D array and per-label voxel counts
+            (index 0 holds the background count).
+    """
+    # bool and uint8 masks share the same 0/1 byte layout, so the
+    # normalization is a free reinterpretation instead of a copy.
+    if img.dtype == np.uint8:
+        img_bool = img.view(bool)
+    elif img.dtype == bool:
+        img_bool = img
+    else:
+        img_bool = img.astype(bool)
+    labels = skimage.morphology.label(img_bool, connectivity=connectivity.value)
+    sizes = np.bincount(labels.ravel())
+    return labels, sizes
 
-    return binary_stack
+
+def apply_min_size_filter(
+    labels: NDArray,
+    sizes: NDArray,
+    min_size: int,
+    out: Optional[NDArray] = None,
+    binary: bool = False,
+) -> NDArray:
+    """Zeros out labeled components smaller than a given size via a label lookup table.
+
+    Args:
+        labels (NDArray): Labeled 3D array.
+        sizes (NDArray): Per-label voxel counts, as returned by label_image_components.
+        min_size (int): Minimum number of pixels required to keep a component.
+        out (Optional[NDArray]): Preallocated output buffer with the shape of
+            labels. If given, the gather writes into it instead of allocating.
+        binary (bool): If True, kept components are written as 1 instead of
+            keeping their label values.
+
+    Returns:
+        NDArray: Labeled 3D array with small components set to zero, or a
+            binary mask if binary is True.
+    """
+    dtype = labels.dtype if out is None else out.dtype
+    if binary:
+        lut = (sizes >= min_size).astype(dtype)
+    else:
+        lut = np.arange(sizes.size, dtype=dtype)
+        lut[sizes < min_size] = 0
+    lut[0] = 0
+    if out is None:
+        return lut[labels]
+    return np.take(lut, labels, out=out)
 
 
 def remove_small_objects(
@@ -50,9 +153,6 @@ def remove_small_objects(
     Returns:
         NDArray: 3D binary array with small objects removed.
     """
-    img_bool = img.astype(bool)
-    labeled_img = skimage.morphology.label(img_bool, connectivity=connectivity.value)
-    filtered = skimage.morphology.remove_small_objects(
-        labeled_img, min_size=min_size, connectivity=connectivity.value
-    )
+    labels, sizes = label_image_components(img, connectivity)
+    filtered = apply_min_size_filter(labels, sizes, min_size)
     return filtered.astype(img.dtype)
@@ -1,9 +1,11 @@
 import numpy as np
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import skimage.segmentation
 from numpy.typing import NDArray
+from scipy import ndimage
 from skimage import measure
 
 from pycroglia.core.enums import SkimageCellConnectivity
@@ -22,11 +24,12 @@ class LabelingStrategy(ABC):
     ARRAY_ELEMENTS_TYPE = np.uint8
 
     @abstractmethod
-    def label(self, img: NDArray) -> NDArray:
+    def label(self, img: Optional[NDArray]) -> NDArray:
         """Labels the input image according to the strategy.
 
         Args:
-            img (NDArray): Input image to label.
+            img (Optional[NDArray]): Input image to label. Strategies
+                that don't read the image accept None.
 
         Returns:
             NDArray: Labeled array.
@@ -84,22 +87,61 @@ class MaskListLabeling(LabelingStrategy):
         """
         self.masks = masks
 
-    def label(self, img: NDArray) -> NDArray:
+    def label(self, img: Optional[NDArray]) -> NDArray:
         """
         Args:
-            img (NDArray): Reference image to determine output shape.
+            img (Optional[NDArray]): Reference image to determine output
+                shape; if None the shape of the first mask is used.
 
         Returns:
             NDArray: Labeled array.
         """
-        labels = np.zeros_like(img, dtype=self.ARRAY_ELEMENTS_TYPE)
+        # Wide enough for the mask count (uint8 overflows past 255
+        # cells); putmask writes each mask in one fused pass without the
+        # boolean-index temporaries.
+        dtype = np.min_scalar_type(len(self.masks))
+        shape = self.masks[0].shape if img is None else img.shape
+        labels = np.zeros(shape, dtype=dtype)
         for idx, mask in enumerate(self.masks, start=1):
-            labels[mask > 0] = idx
+            np.putmask(labels, mask, idx)
 
+        # relabel_sequential is a single LUT remap over the volume; it
+        # closes label gaps left by overlapping masks.
         relabeled, _, _ = skimage.segmentation.relabel_sequential(labels)
         return relabeled
 
 
+class PrecomputedLabeling(LabelingStrategy):
+    """Labeling strategy wrapping an already-composed label volume.
+
+    Used when the caller has built the label volume directly (e.g. the
+    segmentation state writing pass-through cells and segmentation
+    results into one array) instead of collecting per-cell masks.
+    """
+
+    def __init__(self, labels: NDArray):
+        """
+        Args:
+            labels (NDArray): Label volume (same shape as the target image).
+        """
+        self.labels = labels
+
+    def label(self, img: Optional[NDArray]) -> NDArray:
+        """
+        Args:
+            img (Optional[NDArray]): Reference image; unused beyond the
+                interface.
+
+        Returns:
+            NDArray: Labeled array.
+        """
+        # Same normalization as MaskListLabeling: overlapping writes can
+        # fully overwrite an earlier label, and the LUT remap keeps the
+        # ids sequential.
+        relabeled, _, _ = skimage.segmentation.relabel_sequential(self.labels)
+        return relabeled
+
+
 class LabeledCells:
     """Represents labeled connected cell components in a 3D image.
 
@@ -115,19 +157,39 @@ class LabeledCells:
 
     ARRAY_ELEMENTS_TYPE = np.uint8
 
-    def __init__(self, img: NDArray, labeling_strategy: LabelingStrategy):
+    CELL_2D_CACHE_SIZE = 32
+
+    def __init__(self, img: Optional[NDArray], labeling_strategy: LabelingStrategy):
         """Initializes LabeledCells with a 3D image and a labeling strategy.
 
         Args:
-            img (NDArray): 3D binary image.
+            img (Optional[NDArray]): 3D binary image. May be None for
+                strategies that don't read it (e.g. PrecomputedLabeling);
+                the dimensions are taken from the labeled output.
             labeling_strategy (LabelingStrategy): Strategy for labeling connected components.
         """
-        self.z, self.y, self.x = img.shape
         self.labels = labeling_strategy.label(img)
+        self.z, self.y, self.x = self.labels.shape
 
+        # Sizes and the 2D projection are computed back-to-back so both
+        # full-volume scans run while the label buffer is hot in cache;
+        # everything downstream (len, get_sizes, labels_to_2d) reads
+        # these instead of rescanning the volume.
         self._cell_sizes = np.bincount(self.labels.ravel())
         self._n_cells = len(self._cell_sizes) - 1
 
+        # Every later pass over the volume (label comparisons in
+        # get_cell/cell_to_2d, the max projection) is memory-bound, so
+        # the labels are downcast to the smallest dtype that fits the
+        # cell count, kept C-contiguous.
+        label_dtype = np.min_scalar_type(self._n_cells)
+        if self.labels.dtype != label_dtype:
+            self.labels = np.ascontiguousarray(self.labels, dtype=label_dtype)
+
+        self._labels_2d = self.labels.max(axis=0)
+        self._bboxes = ndimage.find_objects(self.labels)
+        self._cell_2d_cache: dict[int, NDArray] = {}
+
     def len(self) -> int:
         """Returns the number of labeled cells.
 
@@ -150,6 +212,10 @@ class LabeledCells:
     def get_cell(self, index: int) -> NDArray:
         """Returns a binary mask for the specified cell.
 
+        The label comparison is restricted to the cell's precomputed
+        bounding box, so the cost scales with the cell volume instead of
+        the whole image.
+
         Args:
             index (int): Cell label index.
 
@@ -162,7 +228,22 @@ class LabeledCells:
         if not self._is_valid_index(index):
             raise PycrogliaException(error_code=2000)
 
-        return (self.labels == index).astype(self.ARRAY_ELEMENTS_TYPE)
+        mask = np.zeros((self.z, self.y, self.x), dtype=self.ARRAY_ELEMENTS_TYPE)
+
+        bbox = self._bboxes[index - 1]
+        if bbox is not None:
+            mask[bbox] = self.labels[bbox] == index
+
+        return mask
+
+    def get_sizes(self) -> NDArray:
+        """Returns the sizes of all cells in a single array.
+
+        Returns:
+            NDArray: Per-cell voxel counts, where position i holds the size
+                of cell label i + 1.
+        """
+        return self._cell_sizes[1:]
 
     def get_cell_size(self, index: int) -> int:
         """Returns the size (number of voxels) of the specified cell.
@@ -181,17 +262,43 @@ class LabeledCells:
 
         return int(self._cell_sizes[index])
 
+    def get_cell_bbox(self, index: int) -> Optional[tuple[slice, ...]]:
+        """Returns the bounding-box slices of the specified cell.
+
+        Args:
+            index (int): Cell label index.
+
+        Returns:
+            Optional[tuple[slice, ...]]: (z, y, x) slices enclosing the
+                cell, or None if the label does not occur in the volume.
+
+        Raises:
+            PycrogliaException: If the index is invalid (error_code=2000).
+        """
+        if not self._is_valid_index(index):
+            raise PycrogliaException(error_code=2000)
+
+        return self._bboxes[index - 1]
+
     def labels_to_2d(self) -> NDArray:
         """Projects the labeled 3D array to 2D by taking the maximum label along the z-axis.
 
+        The projection is computed once at construction time (labels
+        never change afterwards), so this just returns the cached array.
+
         Returns:
             NDArray: 2D array with the maximum label for each (y, x) position.
         """
-        return self.labels.max(axis=0)
+        return self._labels_2d
 
     def cell_to_2d(self, index: int) -> NDArray:
         """Projects a 3D cell to 2D by summing along the z-axis.
 
+        Projections are cached per cell in a small LRU (labels never
+        change after construction), so navigating back and forth between
+        the same cells skips the projection work entirely. On a miss the
+        projection is restricted to the cell's bounding box.
+
         Args:
             index (int): Cell label index.
 
@@ -204,9 +311,26 @@ class LabeledCells:
         if not self._is_valid_index(index):
             raise PycrogliaException(error_code=2000)
 
-        cell_matrix = np.zeros((self.z, self.y, self.x), dtype=self.ARRAY_ELEMENTS_TYPE)
-        cell_matrix[self.labels == index] = 1
-        flatten = cell_matrix.sum(axis=0)
+        cached = self._cell_2d_cache.pop(index, None)
+        if cached is not None:
+            # Reinsert to mark as most recently used
+            self._cell_2d_cache[index] = cached
+            return cached
+
+        # Accumulate in a wide integer: a z-column can stack more voxels
+        # than ARRAY_ELEMENTS_TYPE holds, and a narrow sum would wrap.
+        flatten = np.zeros((self.y, self.x), dtype=np.intp)
+
+        bbox = self._bboxes[index - 1]
+        if bbox is not None:
+            _, y_box, x_box = bbox
+            flatten[y_box, x_box] = (self.labels[bbox] == index).sum(
+                axis=0, dtype=np.intp
+            )
+
+        if len(self._cell_2d_cache) >= self.CELL_2D_CACHE_SIZE:
+            self._cell_2d_cache.pop(next(iter(self._cell_2d_cache)))
+        self._cell_2d_cache[index] = flatten
 
         return flatten
 
@@ -6,6 +6,7 @@ from pycroglia.core.labeled_cells import (
     LabeledCells,
     SkimageImgLabeling,
     MaskListLabeling,
+    PrecomputedLabeling,
 )
 from pycroglia.core.enums import SkimageCellConnectivity
 from pycroglia.core.errors.errors import PycrogliaException
@@ -336,6 +337,20 @@ def test_labeled_cells_get_cell_size():
     assert size == 3
 
 
+def test_labeled_cells_get_sizes():
+    """Test get_sizes returns the voxel counts of all cells.
+
+    Asserts:
+        The array holds one entry per cell matching get_cell_size.
+    """
+    img = stacked_voxels_image()
+    lc = LabeledCells(img, SkimageImgLabeling(DEFAULT_TEST_CONNECTIVITY))
+    sizes = lc.get_sizes()
+
+    assert len(sizes) == lc.len()
+    assert sizes[0] == lc.get_cell_size(1)
+
+
 @pytest.mark.parametrize("index", [-1, 0, 2])
 def test_labeled_cells_get_cell_size_invalid_index(index):
     """Test get_cell_size raises exception for invalid indices.
@@ -371,6 +386,37 @@ def test_labeled_cells_cell_to_2d():
     assert np.sum(got) == 3
 
 
+def test_labeled_cells_cell_to_2d_deep_column():
+    """Test cell_to_2d counts z-columns deeper than 255 voxels.
+
+    Asserts:
+        The projection keeps the exact voxel count instead of wrapping
+        at the narrow storage dtype.
+    """
+    img = np.zeros((300, 3, 3), dtype=np.uint8)
+    img[:, 1, 1] = 1
+    lc = LabeledCells(img, SkimageImgLabeling(DEFAULT_TEST_CONNECTIVITY))
+
+    got = lc.cell_to_2d(1)
+
+    assert got[1, 1] == 300
+
+
+def test_labeled_cells_cell_to_2d_cached():
+    """Test cell_to_2d reuses the cached projection on repeated calls.
+
+    Asserts:
+        The same array object is returned for the same cell.
+    """
+    img = stacked_voxels_image()
+    lc = LabeledCells(img, SkimageImgLabeling(DEFAULT_TEST_CONNECTIVITY))
+
+    first = lc.cell_to_2d(1)
+    second = lc.cell_to_2d(1)
+
+    assert first is second
+
+
 @pytest.mark.parametrize(
     "img_fn, connectivity, index",
     [
@@ -418,3 +464,52 @@ def test_labeled_cells_all_cells_to_2d():
     assert all_2d[0, 0, 0] == 1
     assert all_2d[2, 2, 2] == 1
     assert np.sum(all_2d) == 3
+
+
+def test_precomputed_labeling_label():
+    """Test PrecomputedLabeling returns the wrapped volume with sequential labels.
+
+    Asserts:
+        Label gaps are closed and the occupied voxels keep distinct labels.
+    """
+    labels = np.zeros((2, 2, 2), dtype=np.uint32)
+    labels[0, 0, 0] = 1
+    labels[1, 1, 1] = 3  # gap: label 2 never occurs
+    dummy_img = np.zeros((2, 2, 2), dtype=np.uint8)
+
+    strategy = PrecomputedLabeling(labels)
+    relabeled = strategy.label(dummy_img)
+
+    assert relabeled[0, 0, 0] == 1
+    assert relabeled[1, 1, 1] == 2
+    assert relabeled.max() == 2
+
+
+def test_labeled_cells_get_cell_bbox():
+    """Test get_cell_bbox returns slices enclosing the cell.
+
+    Asserts:
+        Indexing the labels with the bbox yields exactly the cell's voxels.
+    """
+    img = separate_voxels_image()
+    lc = LabeledCells(img, SkimageImgLabeling(DEFAULT_TEST_CONNECTIVITY))
+
+    bbox = lc.get_cell_bbox(1)
+
+    assert bbox is not None
+    assert np.sum(lc.labels[bbox] == 1) == lc.get_cell_size(1)
+
+
+def test_labeled_cells_get_cell_bbox_nok():
+    """Test get_cell_bbox raises exception for invalid index.
+
+    Asserts:
+        PycrogliaException is raised for invalid index.
+    """
+    img = separate_voxels_image()
+    lc = LabeledCells(img, SkimageImgLabeling(DEFAULT_TEST_CONNECTIVITY))
+
+    with pytest.raises(PycrogliaException) as err:
+        lc.get_cell_bbox(0)
+
+    assert err.value.error_code == 2000
@@ -1,9 +1,16 @@
 from typing import Optional
+
+import numpy as np
 from numpy.typing import NDArray
 from PyQt6 import QtCore, QtWidgets
 
 from pycroglia.core.files import create_channeled_reader, MultiChReader
-from pycroglia.core.filters import calculate_otsu_threshold, remove_small_objects
+from pycroglia.core.filters import (
+    apply_min_size_filter,
+    apply_threshold_levels,
+    calculate_otsu_levels,
+    label_image_components,
+)
 
 
 class MultiChImgEditorState(QtCore.QObject):
@@ -36,6 +43,13 @@ class MultiChImgEditorState(QtCore.QObject):
         self._img: Optional[NDArray] = None
         self._gray_filtered_img: Optional[NDArray] = None
         self._small_objects_img: Optional[NDArray] = None
+        self._labels: Optional[NDArray] = None
+        self._label_sizes: Optional[NDArray] = None
+        self._small_objects_bufs: Optional[tuple[NDArray, NDArray]] = None
+        self._small_objects_buf_idx = 0
+        self._otsu_levels: Optional[NDArray] = None
+        self._last_adjust: Optional[float] = None
+        self._last_threshold: Optional[int] = None
 
     def get_img(self) -> Optional[NDArray]:
         """Return the original loaded image.
@@ -86,6 +100,11 @@ class MultiChImgEditorState(QtCore.QObject):
             self._img = self.reader.read(ch=ch, ch_interest=chi)
             self._gray_filtered_img = None
             self._small_objects_img = None
+            self._labels = None
+            self._label_sizes = None
+            self._otsu_levels = None
+            self._last_adjust = None
+            self._last_threshold = None
 
             self.imageChanged.emit()
         finally:
@@ -94,17 +113,37 @@ class MultiChImgEditorState(QtCore.QObject):
     def get_midslice(self, arr: NDArray):
         """Get the middle slice of a 3D array.
 
+        Volumes are stored as (zs, height, width) with z outermost, so the
+        middle z-plane is a contiguous view; it is returned without copying
+        so downstream consumers (e.g. pyqtgraph) don't force another copy.
+
         Args:
-            arr (NDArray): 3D image array.
+            arr (NDArray): 3D image array with shape (zs, height, width).
 
         Returns:
-            NDArray: Middle slice of the image.
+            NDArray: Middle z-plane of the image, C-contiguous.
+        """
+        return np.ascontiguousarray(arr[arr.shape[0] // 2, :, :])
+
+    def write_midslice_into(self, arr: NDArray, out: NDArray):
+        """Copy the middle slice of a 3D array into a preallocated buffer.
+
+        Writing into a reusable C-contiguous buffer avoids allocating a new
+        slice array on every update.
+
+        Args:
+            arr (NDArray): 3D image array.
+            out (NDArray): Preallocated 2D buffer with the slice shape and dtype.
         """
-        return arr[arr.shape[0] // 2, :, :]
+        np.copyto(out, arr[arr.shape[0] // 2, :, :])
 
     def apply_otsu_gray_filter(self, adjust_value: float) -> Optional[NDArray]:
         """Apply the Otsu threshold filter with adjustment.
 
+        The per-slice Otsu levels only depend on the loaded image, so they
+        are computed once and cached; adjustment changes re-apply them with
+        a single thresholding pass.
+
         Args:
             adjust_value (float): Adjustment value for the threshold.
 
@@ -116,8 +155,17 @@ class MultiChImgEditorState(QtCore.QObject):
             if self._img is None:
                 return None
 
-            masked_image = calculate_otsu_threshold(self._img, adjust_value)
+            if self._otsu_levels is None:
+                self._otsu_levels = calculate_otsu_levels(self._img)
+
+            masked_image = apply_threshold_levels(
+                self._img, self._otsu_levels, adjust_value
+            )
             self._gray_filtered_img = masked_image
+            self._labels = None
+            self._label_sizes = None
+            self._last_adjust = adjust_value
+            self._last_threshold = None
 
             self.grayImageChanged.emit()
             return self._gray_filtered_img
@@ -127,6 +175,10 @@ class MultiChImgEditorState(QtCore.QObject):
     def apply_small_object_filter(self, threshold: int) -> Optional[NDArray]:
         """Remove small objects from the filtered image.
 
+        Connected components and their sizes are computed once per
+        gray-filtered image, so successive threshold changes only re-apply
+        a lookup table over the cached labels.
+
         Args:
             threshold (int): Minimum object size threshold.
 
@@ -138,9 +190,63 @@ class MultiChImgEditorState(QtCore.QObject):
             if self._gray_filtered_img is None:
                 return None
 
-            masked_img = remove_small_objects(self._gray_filtered_img, threshold)
-            self._small_objects_img = masked_img
+            if self._labels is None:
+                self._labels, self._label_sizes = label_image_components(
+                    self._gray_filtered_img
+                )
+                # Two buffers alternated per call, so successive results are
+                # distinct ndarray objects and consumers that elide re-renders
+                # by identity still see every threshold change.
+                self._small_objects_bufs = (
+                    np.empty(
+                        self._gray_filtered_img.shape,
+                        dtype=self._gray_filtered_img.dtype,
+                    ),
+                    np.empty(
+                        self._gray_filtered_img.shape,
+                        dtype=self._gray_filtered_img.dtype,
+                    ),
+                )
+
+            out = self._small_objects_bufs[self._small_objects_buf_idx]
+            self._small_objects_buf_idx ^= 1
+
+            # Downstream consumers only need a binary mask, so the result is
+            # stored as a uint8 0/1 volume rather than kept label values.
+            self._small_objects_img = apply_min_size_filter(
+                self._labels,
+                self._label_sizes,
+                threshold,
+                out=out,
+                binary=True,
+            )
+            self._last_threshold = threshold
 
             return self._small_objects_img
         finally:
             self._mutex.unlock()
+
+    def finalize(self, adjust_value: float, threshold: int) -> Optional[NDArray]:
+        """Ensure the filter chain reflects the given parameters and return the result.
+
+        Only the stages whose parameters differ from the last applied ones
+        are re-run, so exporting right after slider interaction typically
+        returns the cached result without recomputation.
+
+        Args:
+            adjust_value (float): Adjustment value for the gray filter.
+            threshold (int): Minimum object size threshold.
+
+        Returns:
+            Optional[NDArray]: Final filtered image or None if no image loaded.
+        """
+        if self.get_img() is None:
+            return None
+
+        if self.get_gray_filtered_img() is None or self._last_adjust != adjust_value:
+            self.apply_otsu_gray_filter(adjust_value)
+
+        if self.get_small_objects_img() is None or self._last_threshold != threshold:
+            self.apply_small_object_filter(threshold)
+
+        return self.get_small_objects_img()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 from PyQt6 import QtCore, QtWidgets
@@ -9,7 +9,7 @@ from pycroglia.core.erosion import Octahedron3DFootprint
 from pycroglia.core.labeled_cells import (
     LabelingStrategy,
     LabeledCells,
-    MaskListLabeling,
+    PrecomputedLabeling,
 )
 from pycroglia.core.segmentation import segment_single_cell, SegmentationConfig
 
@@ -21,14 +21,11 @@ class SegmentationEditorState(QtCore.QObject):
     and progress bar updates.
 
     Attributes:
-        ARRAY_ELEMENTS_TYPE (type): Data type for output arrays.
         DEFAULT_EROSION_FOOTPRINT (FootprintShape): Default structuring element for erosion.
         DEFAULT_SKIMAGE_CONNECTIVITY (SkimageCellConnectivity): Default connectivity for labeling.
         DEFAULT_PROGRESS_BAR_TEXT (str): Default text for the progress bar.
     """
 
-    ARRAY_ELEMENTS_TYPE = np.uint8
-
     DEFAULT_EROSION_FOOTPRINT = Octahedron3DFootprint(r=1)
     DEFAULT_SKIMAGE_CONNECTIVITY = SkimageCellConnectivity.CORNERS
 
@@ -66,8 +63,6 @@ class SegmentationEditorState(QtCore.QObject):
         """
         super().__init__(parent=parent)
 
-        self._shape = img.shape
-
         self._actual_state = LabeledCells(img, labeling_strategy)
         self._prev_state: Optional[LabeledCells] = None
 
@@ -102,57 +97,73 @@ class SegmentationEditorState(QtCore.QObject):
         self,
         cell_index: int,
         cell_size: int,
-        progress_bar: Optional[QtWidgets.QProgressDialog] = None,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        cancel_cb: Optional[Callable[[], bool]] = None,
     ):
         """Segments a specific cell and updates the segmentation state.
 
+        This method is UI-agnostic and safe to run on a worker thread;
+        progress reporting and cancellation go through plain callables.
+
         Args:
             cell_index (int): Index of the cell to segment.
             cell_size (int): Minimum size for segmentation.
-            progress_bar (Optional[QtWidgets.QProgressDialog], optional): Progress dialog to update. Defaults to None.
+            progress_cb (Optional[Callable[[int, int], None]]): Called with
+                (current cell, total cells) before and after the target
+                cell is segmented.
+            cancel_cb (Optional[Callable[[], bool]]): Polled around the
+                segmentation work; returning True aborts without
+                changing the state.
         """
-        list_of_cells: list[NDArray] = []
         number_of_cells = self._actual_state.len()
 
-        # If progress bar was passed
-        if progress_bar:
-            progress_bar.setMaximum(number_of_cells)
-            progress_bar.setValue(0)
-            progress_bar.setLabelText(self.DEFAULT_PROGRESS_BAR_TEXT)
-            QtCore.QCoreApplication.processEvents()
-
-        for i in range(1, number_of_cells + 1):
-            if progress_bar:
-                progress_bar.setValue(i)
-                progress_bar.setLabelText(
-                    self.DEFAULT_PROGRESS_BAR_TEXT_GENERATOR(i, number_of_cells)
-                )
-                QtCore.QCoreApplication.processEvents()
-
-                if progress_bar.wasCanceled():
-                    return
-
-            if cell_index == i:
-                segmented_cell = segment_single_cell(
-                    cell_matrix=self._actual_state.get_cell(i),
-                    footprint=self.DEFAULT_EROSION_FOOTPRINT,
-                    config=SegmentationConfig(
-                        cut_off_size=cell_size,
-                        min_size=self._min_size,
-                        connectivity=self.DEFAULT_SKIMAGE_CONNECTIVITY,
-                    ),
-                )
-                list_of_cells.extend(segmented_cell)
-            else:
-                list_of_cells.append(self._actual_state.get_cell(i))
-
-        if progress_bar:
-            progress_bar.setValue(number_of_cells)
-
-        new_state = LabeledCells(
-            np.zeros(self._shape, dtype=self.ARRAY_ELEMENTS_TYPE),
-            MaskListLabeling(list_of_cells),
+        if cancel_cb is not None and cancel_cb():
+            return
+
+        if progress_cb is not None:
+            progress_cb(cell_index, number_of_cells)
+
+        bbox = self._actual_state.get_cell_bbox(cell_index)
+        if bbox is None:
+            return
+
+        # The bbox crop is all segment_single_cell needs: erosion, size
+        # filtering and GMM clustering are translation-invariant, and
+        # everything outside the target's bbox is background for that
+        # cell anyway.
+        cell_crop = (self._actual_state.labels[bbox] == cell_index).view(np.uint8)
+        segmented_cell = segment_single_cell(
+            cell_matrix=cell_crop,
+            footprint=self.DEFAULT_EROSION_FOOTPRINT,
+            config=SegmentationConfig(
+                cut_off_size=cell_size,
+                min_size=self._min_size,
+                connectivity=self.DEFAULT_SKIMAGE_CONNECTIVITY,
+            ),
         )
+
+        if cancel_cb is not None and cancel_cb():
+            return
+
+        # Pass-through cells never move, so the label volume is copied
+        # once and only the target's voxels are rewritten: cleared, then
+        # filled with sub-cell ids past the current maximum. The relabel
+        # pass in PrecomputedLabeling closes the gap left by the target.
+        new_labels = self._actual_state.labels.astype(np.uint32)
+        region = new_labels[bbox]
+        region[self._actual_state.labels[bbox] == cell_index] = 0
+
+        next_label = number_of_cells
+        for mask in segmented_cell:
+            next_label += 1
+            np.putmask(region, mask, next_label)
+
+        if progress_cb is not None:
+            progress_cb(number_of_cells, number_of_cells)
+
+        # No reference image: PrecomputedLabeling never reads it, so the
+        # throwaway full-volume zeros placeholder is skipped.
+        new_state = LabeledCells(None, PrecomputedLabeling(new_labels))
         self._update_state(new_state)
         self.stateChanged.emit()
 
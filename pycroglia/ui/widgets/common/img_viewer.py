@@ -5,6 +5,41 @@ from PyQt6 import QtWidgets
 from pyqtgraph import ImageView
 
 
+def make_minimal_image_view(parent: Optional[QtWidgets.QWidget] = None) -> ImageView:
+    """Creates an ImageView without histogram, menu and ROI controls.
+
+    The histogram is also detached from image updates, so setImage calls
+    don't trigger a histogram recompute. The widgets are hidden rather
+    than deleted because ImageView keeps internal references to them.
+
+    Args:
+        parent (Optional[QtWidgets.QWidget]): Parent widget. Defaults to None.
+
+    Returns:
+        ImageView: Image view with only the image display enabled.
+    """
+    viewer = ImageView(parent=parent)
+
+    # The scene only ever holds an axis-aligned raster, so the view can
+    # skip the per-repaint antialiasing margin Qt adds to dirty regions.
+    # pyqtgraph's GraphicsView already uses MinimalViewportUpdate and
+    # caches the background.
+    viewer.ui.graphicsView.setOptimizationFlag(
+        QtWidgets.QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+    )
+
+    histogram = viewer.ui.histogram
+    try:
+        viewer.imageItem.sigImageChanged.disconnect(histogram.item.imageChanged)
+    except TypeError:
+        pass
+
+    for component in (histogram, viewer.ui.menuBtn, viewer.ui.roiBtn):
+        component.hide()
+
+    return viewer
+
+
 class CustomImageViewer(QtWidgets.QWidget):
     """Widget for displaying images using pyqtgraph's ImageView.
 
@@ -20,24 +55,22 @@ class CustomImageViewer(QtWidgets.QWidget):
         super().__init__(parent=parent)
 
         # Widget
-        viewer = ImageView(parent=self)
-        for component in (viewer.ui.histogram, viewer.ui.menuBtn, viewer.ui.roiBtn):
-            component.hide()
-
-        self.img_viewer = viewer
+        self.img_viewer = make_minimal_image_view(parent=self)
 
         # Layout
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.img_viewer)
         self.setLayout(layout)
 
-    def set_image(self, img: NDArray):
+    def set_image(self, img: NDArray, **kwargs):
         """Sets the image to be displayed.
 
         Args:
             img (NDArray): Image array to display.
+            **kwargs: Extra arguments forwarded to pyqtgraph's setImage
+                (e.g. autoLevels, levels).
         """
-        self.img_viewer.setImage(img)
+        self.img_viewer.setImage(img, **kwargs)
 
     def set_lookup_table(self, lu: NDArray):
         """Sets the lookup table for coloring the image.
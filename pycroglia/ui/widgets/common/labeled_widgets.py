@@ -36,9 +36,9 @@ class LabeledSpinBox(QtWidgets.QWidget):
         self.label.setText(label_text)
 
         self.spin_box = QtWidgets.QSpinBox()
-        if min_value:
+        if min_value is not None:
             self.spin_box.setMinimum(min_value)
-        if max_value:
+        if max_value is not None:
             self.spin_box.setMaximum(max_value)
         self.spin_box.valueChanged.connect(self._value_changed)
 
@@ -59,10 +59,15 @@ class LabeledSpinBox(QtWidgets.QWidget):
             max_value (int): New maximum value.
         """
         current_value = self.spin_box.value()
+
+        # setMaximum clamps the value itself and would fire valueChanged;
+        # block its signals so the clamp is emitted exactly once below.
+        self.spin_box.blockSignals(True)
         self.spin_box.setMaximum(max_value)
+        self.spin_box.blockSignals(False)
 
         if current_value > max_value:
-            self.spin_box.setValue(current_value)
+            self.valueChanged.emit(max_value)
 
     def get_value(self) -> int:
         """Get the current value of the SpinBox.
@@ -187,6 +192,14 @@ class LabeledFloatSlider(QtWidgets.QWidget):
         self._int_min = 0
         self._int_max = int(round((self._max - self._min) / self._step))
 
+        # Precomputed lookup tables: slider positions are a small discrete
+        # set, so values and label texts are resolved by indexing instead of
+        # recomputing arithmetic and formatting on every tick.
+        self._values = tuple(
+            round(self._min + i * self._step, 10) for i in range(self._int_max + 1)
+        )
+        self._formatted = tuple(f"{v:.2f}" for v in self._values)
+
         # Widgets
         self.min_label = QtWidgets.QLabel(f"{self._min:.2f}")
         self.max_label = QtWidgets.QLabel(f"{self._max:.2f}")
@@ -217,8 +230,8 @@ class LabeledFloatSlider(QtWidgets.QWidget):
         Args:
             value (int): Integer value from the slider.
         """
-        float_value = self._min + value * self._step
-        self.value_label.setText(f"{self.label_text}: {float_value:.2f}")
+        float_value = self._values[value]
+        self.value_label.setText(f"{self.label_text}: {self._formatted[value]}")
         self.valueChanged.emit(float_value)
 
     def get_value(self) -> float:
@@ -227,8 +240,7 @@ class LabeledFloatSlider(QtWidgets.QWidget):
         Returns:
             float: Current value.
         """
-        int_value = self.slider.value()
-        return self._min + int_value * self._step
+        return self._values[self.slider.value()]
 
     def set_value(self, float_value: float):
         """Set the slider value from a float.
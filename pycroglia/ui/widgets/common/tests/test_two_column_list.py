@@ -47,8 +47,26 @@ def test_two_column_list_add_item(two_column_list, qtbot):
         two_column_list.add_item("PDF", "/path/to/file.pdf")
 
     assert two_column_list.model.rowCount() == 1
-    assert two_column_list.model.item(0, 0).text() == "PDF"
-    assert two_column_list.model.item(0, 1).text() == "/path/to/file.pdf"
+    assert two_column_list.model.data(two_column_list.model.index(0, 0)) == "PDF"
+    assert (
+        two_column_list.model.data(two_column_list.model.index(0, 1))
+        == "/path/to/file.pdf"
+    )
+
+
+def test_two_column_list_add_items_batch(two_column_list, qtbot):
+    """Test that add_items adds all rows and emits dataChanged once (TwoColumnList)."""
+    with qtbot.waitSignal(two_column_list.dataChanged, timeout=100):
+        two_column_list.add_items(
+            [("PDF", "/path/to/file.pdf"), ("DOCX", "/path/to/file.docx")]
+        )
+
+    assert two_column_list.model.rowCount() == 2
+    assert two_column_list.model.data(two_column_list.model.index(0, 0)) == "PDF"
+    assert (
+        two_column_list.model.data(two_column_list.model.index(1, 1))
+        == "/path/to/file.docx"
+    )
 
 
 def test_two_column_list_get_column_returns_correct_values(two_column_list):
@@ -120,8 +138,9 @@ def test_two_column_list_with_delete_delete_with_selection(
     with qtbot.waitSignal(two_column_list_with_delete.dataChanged, timeout=1000):
         two_column_list_with_delete._remove_selected_item()
 
-    assert two_column_list_with_delete.model.rowCount() == 1
-    assert two_column_list_with_delete.model.item(0, 0).text() == "DOCX"
+    model = two_column_list_with_delete.model
+    assert model.rowCount() == 1
+    assert model.data(model.index(0, 0)) == "DOCX"
 
 
 def test_two_column_list_with_delete_no_delete_without_selection(
@@ -1,22 +1,179 @@
-from PyQt6 import QtWidgets, QtCore, QtGui
+from PyQt6 import QtWidgets, QtCore
 from typing import Optional, List
 
 
+class TwoColumnTableModel(QtCore.QAbstractTableModel):
+    """Table model backed by two Python lists of strings.
+
+    Rows are stored as two parallel lists instead of per-row item
+    objects, so inserts don't allocate QObjects and painting only
+    queries the visible rows for their display strings.
+
+    Attributes:
+        headers (List[str]): Column headers.
+    """
+
+    COLUMN_COUNT: int = 2
+
+    def __init__(self, headers: List[str], parent: Optional[QtCore.QObject] = None):
+        """Initializes the TwoColumnTableModel.
+
+        Args:
+            headers (List[str]): Column headers.
+            parent (Optional[QtCore.QObject]): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+
+        self.headers = headers
+        self._first: List[str] = []
+        self._second: List[str] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Returns the number of rows in the model.
+
+        Args:
+            parent (QtCore.QModelIndex): Parent index. Defaults to an invalid index.
+
+        Returns:
+            int: Number of rows.
+        """
+        if parent.isValid():
+            return 0
+        return len(self._first)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Returns the number of columns in the model.
+
+        Args:
+            parent (QtCore.QModelIndex): Parent index. Defaults to an invalid index.
+
+        Returns:
+            int: Number of columns.
+        """
+        if parent.isValid():
+            return 0
+        return self.COLUMN_COUNT
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Optional[str]:
+        """Returns the display value for the given index.
+
+        Args:
+            index (QtCore.QModelIndex): Model index.
+            role (int): Item data role. Defaults to DisplayRole.
+
+        Returns:
+            Optional[str]: Cell value as string, or None for other roles.
+        """
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+
+        column = self._first if index.column() == 0 else self._second
+        return column[index.row()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Optional[str]:
+        """Returns the header label for the given section.
+
+        Args:
+            section (int): Column index.
+            orientation (QtCore.Qt.Orientation): Header orientation.
+            role (int): Item data role. Defaults to DisplayRole.
+
+        Returns:
+            Optional[str]: Header label, or None for other roles.
+        """
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.headers[section]
+        return None
+
+    def append_rows(self, rows: List[tuple[str, str]]):
+        """Appends several rows in a single insert.
+
+        Args:
+            rows (List[tuple[str, str]]): (first column, second column) values.
+        """
+        if not rows:
+            return
+
+        first_row = len(self._first)
+        self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(rows) - 1)
+        for first, second in rows:
+            self._first.append(first)
+            self._second.append(second)
+        self.endInsertRows()
+
+    def remove_row(self, row: int):
+        """Removes the given row.
+
+        Args:
+            row (int): Row index.
+        """
+        self.remove_rows(row, 1)
+
+    def remove_rows(self, first: int, count: int):
+        """Removes a contiguous block of rows in a single remove.
+
+        Args:
+            first (int): Index of the first row to remove.
+            count (int): Number of rows to remove.
+        """
+        self.beginRemoveRows(QtCore.QModelIndex(), first, first + count - 1)
+        del self._first[first : first + count]
+        del self._second[first : first + count]
+        self.endRemoveRows()
+
+    def get_row(self, row: int) -> tuple[str, str]:
+        """Returns the values stored at the given row.
+
+        Args:
+            row (int): Row index.
+
+        Returns:
+            tuple[str, str]: Tuple of (first column, second column).
+        """
+        return self._first[row], self._second[row]
+
+    def get_column(self, column_index: int) -> List[str]:
+        """Returns a copy of the given column's values.
+
+        Args:
+            column_index (int): Index of the column (0 or 1).
+
+        Returns:
+            List[str]: List of values in the column.
+        """
+        return list(self._first if column_index == 0 else self._second)
+
+
 class TwoColumnList(QtWidgets.QWidget):
     """Widget for displaying a two-column list with optional selection and data change signals.
 
     Attributes:
         headers (List[str]): Column headers.
         table_view (QtWidgets.QTableView): Table view widget.
-        model (QtGui.QStandardItemModel): Model for the table view.
+        model (TwoColumnTableModel): List-backed model for the table view.
         dataChanged (QtCore.pyqtSignal): Signal emitted when the data changes.
         selectionChanged (QtCore.pyqtSignal): Signal emitted when the selection changes.
     """
 
     DEFAULT_HEADER_RESIZE_MODES = [
-        QtWidgets.QHeaderView.ResizeMode.ResizeToContents,
+        QtWidgets.QHeaderView.ResizeMode.Fixed,
         QtWidgets.QHeaderView.ResizeMode.Stretch,
     ]
+    # Width template for the fixed first column; sized for short tokens
+    # such as file suffixes without measuring every row.
+    FIRST_COLUMN_WIDTH_TEMPLATE = "WWWWWWWWW"
 
     dataChanged = QtCore.pyqtSignal()
     selectionChanged = QtCore.pyqtSignal()
@@ -33,6 +190,13 @@ class TwoColumnList(QtWidgets.QWidget):
         # Configuration
         self.headers: List[str] = headers
 
+        # Coalesces bursts of model edits into one dataChanged emission
+        # per event-loop turn.
+        self._data_changed_timer = QtCore.QTimer(self)
+        self._data_changed_timer.setSingleShot(True)
+        self._data_changed_timer.setInterval(0)
+        self._data_changed_timer.timeout.connect(self.dataChanged.emit)
+
         # Table view - Behavior
         self.table_view = QtWidgets.QTableView()
         self.table_view.setSelectionBehavior(
@@ -46,17 +210,28 @@ class TwoColumnList(QtWidgets.QWidget):
         header = self.table_view.horizontalHeader()
         for i, mode in enumerate(self.DEFAULT_HEADER_RESIZE_MODES):
             header.setSectionResizeMode(i, mode)
+        header.resizeSection(
+            0,
+            self.fontMetrics().horizontalAdvance(self.FIRST_COLUMN_WIDTH_TEMPLATE),
+        )
         header.setStretchLastSection(True)
-        self.table_view.verticalHeader().hide()
+
+        # Rows are single-line strings, so they all share one fixed
+        # height and the view never measures size hints per row.
+        vertical_header = self.table_view.verticalHeader()
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + 4)
+        vertical_header.hide()
 
         # Table model
-        self.model = QtGui.QStandardItemModel(0, 2)
-        self.model.setHorizontalHeaderLabels(self.headers)
+        self.model = TwoColumnTableModel(headers=self.headers, parent=self)
         self.table_view.setModel(self.model)
 
-        # Connections
+        # Connections - unique so an accidental reconnect can't double
+        # every selection notification.
         self.table_view.selectionModel().selectionChanged.connect(
-            self._on_selection_changed
+            self._on_selection_changed,
+            QtCore.Qt.ConnectionType.UniqueConnection,
         )
 
         # Layout
@@ -72,14 +247,20 @@ class TwoColumnList(QtWidgets.QWidget):
             first_row (str): Value for the first column.
             second_row (str): Value for the second column.
         """
-        first_row = QtGui.QStandardItem(first_row)
-        second_row = QtGui.QStandardItem(second_row)
+        self.add_items([(first_row, second_row)])
+
+    def add_items(self, rows: List[tuple[str, str]]):
+        """Add several items to the list in one batch.
 
-        first_row.setEditable(False)
-        second_row.setEditable(False)
+        All rows go in through a single insert, so the view lays out
+        once instead of once per row, and dataChanged is coalesced to a
+        single emission per event-loop turn.
 
-        self.model.appendRow([first_row, second_row])
-        self.dataChanged.emit()
+        Args:
+            rows (List[tuple[str, str]]): (first column, second column) values.
+        """
+        self.model.append_rows(rows)
+        self._data_changed_timer.start()
 
     def get_column(self, column_index: int) -> List[str]:
         """Return all items from the specified column (excluding header).
@@ -96,10 +277,7 @@ class TwoColumnList(QtWidgets.QWidget):
         if column_index >= 2:
             raise ValueError("Column index must be 0 or 1.")
 
-        return [
-            self.model.item(row, column_index).text()
-            for row in range(self.model.rowCount())
-        ]
+        return self.model.get_column(column_index)
 
     def get_selected_item(self) -> Optional[tuple[str, str]]:
         """Return the currently selected item as a tuple.
@@ -111,8 +289,7 @@ class TwoColumnList(QtWidgets.QWidget):
         if not indexes:
             return None
 
-        row = indexes[0].row()
-        return (self.model.item(row, 0).text(), self.model.item(row, 1).text())
+        return self.model.get_row(indexes[0].row())
 
     def _on_selection_changed(self):
         """Emit the selectionChanged signal when the selection changes."""
@@ -158,11 +335,31 @@ class TwoColumnListWithDelete(TwoColumnList):
         self.delete_button.setEnabled(has_selection)
 
     def _remove_selected_item(self):
-        """Remove the currently selected item(s) from the list."""
+        """Remove the currently selected item(s) from the list.
+
+        Consecutive selected rows are removed as one block, so a
+        contiguous selection costs a single model remove instead of one
+        per row.
+        """
         selection_model = self.table_view.selectionModel()
         selected_rows = selection_model.selectedRows()
 
-        for model_index in reversed(selected_rows):
-            self.model.removeRow(model_index.row())
-
-        self.dataChanged.emit()
+        blocks: List[List[int]] = []
+        for row in sorted({model_index.row() for model_index in selected_rows}):
+            if blocks and row == blocks[-1][0] + blocks[-1][1]:
+                blocks[-1][1] += 1
+            else:
+                blocks.append([row, 1])
+
+        # Remove back to front so earlier block indices stay valid. The
+        # selection model updates silently per block; the selection is
+        # re-evaluated once when all blocks are gone.
+        selection_model.blockSignals(True)
+        try:
+            for first, count in reversed(blocks):
+                self.model.remove_rows(first, count)
+        finally:
+            selection_model.blockSignals(False)
+
+        self._on_selection_changed()
+        self._data_changed_timer.start()
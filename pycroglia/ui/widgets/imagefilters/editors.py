@@ -1,22 +1,47 @@
 from typing import Optional
+
+import numpy as np
 from numpy.typing import NDArray
 
 from PyQt6 import QtWidgets, QtCore
-from pyqtgraph import ImageView
-
 from pycroglia.ui.controllers.ch_editor import MultiChImgEditorState
 from pycroglia.ui.widgets.common.labeled_widgets import (
     LabeledSpinBox,
     LabeledFloatSlider,
 )
+from pycroglia.ui.widgets.common.img_viewer import make_minimal_image_view
 from pycroglia.ui.widgets.imagefilters.configurator import MultiChannelConfigurator
 from pycroglia.ui.widgets.imagefilters.tasks import (
     ImageReaderTask,
     GrayFilterTask,
     SmallObjectFilterTask,
+    TaskSignals,
 )
 
 
+def _copy_midslice(
+    state: MultiChImgEditorState, img: NDArray, buf: Optional[NDArray]
+) -> NDArray:
+    """Copy the middle slice of an image into a reusable C-contiguous buffer.
+
+    The buffer is lazily (re)allocated only when the slice shape or dtype
+    changes, so repeated updates reuse the same memory.
+
+    Args:
+        state (MultiChImgEditorState): State used to extract the slice.
+        img (NDArray): 3D image array.
+        buf (Optional[NDArray]): Buffer from the previous update, or None.
+
+    Returns:
+        NDArray: Buffer holding the middle slice of the image.
+    """
+    slice_shape = img.shape[1:]
+    if buf is None or buf.shape != slice_shape or buf.dtype != img.dtype:
+        buf = np.empty(slice_shape, dtype=img.dtype)
+    state.write_midslice_into(img, buf)
+    return buf
+
+
 class MultiChannelImageViewer(QtWidgets.QWidget):
     """Widget for viewing multi-channel images.
 
@@ -61,16 +86,15 @@ class MultiChannelImageViewer(QtWidgets.QWidget):
         self.read_button_text = read_button_text or self.DEFAULT_READ_BUTTON_TEXT
 
         self.state = state
-        self.tpool = QtCore.QThreadPool(self)
+        self.tpool = QtCore.QThreadPool.globalInstance()
+        self.task_signals = TaskSignals()
+        self._slice_buf: Optional[NDArray] = None
 
         # Widgets
         self.label = QtWidgets.QLabel(parent=self)
         self.label.setText(self.label_text)
 
-        viewer = ImageView(parent=self)
-        for component in (viewer.ui.histogram, viewer.ui.menuBtn, viewer.ui.roiBtn):
-            component.hide()
-        self.viewer = viewer
+        self.viewer = make_minimal_image_view(parent=self)
 
         self.editor = MultiChannelConfigurator(
             channels_label=channels_label or self.DEFAULT_CHANNELS_LABEL,
@@ -83,6 +107,7 @@ class MultiChannelImageViewer(QtWidgets.QWidget):
         self.read_button.setText(self.read_button_text)
 
         # Connections
+        self.task_signals.finished.connect(self._on_image_ready)
         self.read_button.clicked.connect(self._on_read_button_press)
 
         # Layout
@@ -99,13 +124,14 @@ class MultiChannelImageViewer(QtWidgets.QWidget):
             state=self.state,
             ch=self.editor.get_channels(),
             chi=self.editor.get_channel_of_interest(),
+            signals=self.task_signals,
         )
-        task.signals.finished.connect(self._on_image_ready)
         self.tpool.start(task)
 
     def _on_image_ready(self):
         img = self.state.get_img()
-        self.viewer.setImage(self.state.get_midslice(img))
+        self._slice_buf = _copy_midslice(self.state, img, self._slice_buf)
+        self.viewer.setImage(self._slice_buf)
 
 
 class GrayFilterEditor(QtWidgets.QWidget):
@@ -152,16 +178,16 @@ class GrayFilterEditor(QtWidgets.QWidget):
         self.slider_label_text = slider_label_text or self.DEFAULT_SLIDER_LABEL_TEXT
 
         self.state = state
-        self.tpool = QtCore.QThreadPool(self)
+        self.tpool = QtCore.QThreadPool.globalInstance()
+        self.task_signals = TaskSignals()
+        self._slice_buf: Optional[NDArray] = None
+        self._last_img: Optional[NDArray] = None
 
         # Widgets
         self.label = QtWidgets.QLabel(parent=self)
         self.label.setText(self.label_text)
 
-        viewer = ImageView(parent=self)
-        for component in (viewer.ui.histogram, viewer.ui.menuBtn, viewer.ui.roiBtn):
-            component.hide()
-        self.viewer = viewer
+        self.viewer = make_minimal_image_view(parent=self)
 
         self.slider = LabeledFloatSlider(
             label_text=self.slider_label_text,
@@ -171,7 +197,8 @@ class GrayFilterEditor(QtWidgets.QWidget):
         )
 
         # Connections
-        self.state.imageChanged.connect(self._on_filter_update)
+        self.task_signals.finished.connect(self._on_image_ready)
+        self.state.imageChanged.connect(self._on_source_changed)
         self.slider.valueChanged.connect(self._on_filter_update)
 
         # Layout
@@ -181,16 +208,39 @@ class GrayFilterEditor(QtWidgets.QWidget):
         layout.addWidget(self.slider)
         self.setLayout(layout)
 
-    def _on_filter_update(self):
-        """Update the view when the gray filter is applied."""
-        task = GrayFilterTask(state=self.state, adjust_value=self.slider.get_value())
-        task.signals.finished.connect(self._on_image_ready)
+    def _on_source_changed(self):
+        """Invalidate the identity guard and refresh when the source image changes."""
+        self._last_img = None
+        self._on_filter_update()
+
+    def _on_filter_update(self, value: Optional[float] = None):
+        """Update the view when the gray filter is applied.
+
+        Args:
+            value (Optional[float]): Adjustment value carried by the slider
+                signal. Read from the slider when not provided.
+        """
+        if value is None:
+            value = self.slider.get_value()
+
+        task = GrayFilterTask(
+            state=self.state, adjust_value=value, signals=self.task_signals
+        )
         self.tpool.start(task)
 
     def _on_image_ready(self):
         img = self.state.get_gray_filtered_img()
-        if img is not None:
-            self.viewer.setImage(self.state.get_midslice(img))
+        if img is None or img is self._last_img:
+            return
+
+        self._last_img = img
+        auto_range = self._slice_buf is None
+        self._slice_buf = _copy_midslice(self.state, img, self._slice_buf)
+        # The slice is a uint8 binary mask; fixed levels let pyqtgraph take
+        # its fast LUT path instead of rescaling on every update.
+        self.viewer.setImage(
+            self._slice_buf, autoLevels=False, levels=(0, 1), autoRange=auto_range
+        )
 
 
 class SmallObjectsFilterEditor(QtWidgets.QWidget):
@@ -237,16 +287,16 @@ class SmallObjectsFilterEditor(QtWidgets.QWidget):
         )
 
         self.state = state
-        self.tpool = QtCore.QThreadPool(self)
+        self.tpool = QtCore.QThreadPool.globalInstance()
+        self.task_signals = TaskSignals()
+        self._slice_buf: Optional[NDArray] = None
+        self._last_img: Optional[NDArray] = None
 
         # Widgets
         self.label = QtWidgets.QLabel(parent=self)
         self.label.setText(self.label_text)
 
-        viewer = ImageView(parent=self)
-        for component in (viewer.ui.histogram, viewer.ui.menuBtn, viewer.ui.roiBtn):
-            component.hide()
-        self.viewer = viewer
+        self.viewer = make_minimal_image_view(parent=self)
 
         self.spin_box = LabeledSpinBox(
             label_text=self.threshold_label_text,
@@ -256,7 +306,8 @@ class SmallObjectsFilterEditor(QtWidgets.QWidget):
         )
 
         # Connections
-        self.state.grayImageChanged.connect(self._on_filter_update)
+        self.task_signals.finished.connect(self._on_image_ready)
+        self.state.grayImageChanged.connect(self._on_source_changed)
         self.spin_box.valueChanged.connect(self._on_filter_update)
 
         # Layout
@@ -266,18 +317,39 @@ class SmallObjectsFilterEditor(QtWidgets.QWidget):
         layout.addWidget(self.spin_box)
         self.setLayout(layout)
 
-    def _on_filter_update(self):
-        """Update the view when the small objects filter is applied."""
+    def _on_source_changed(self):
+        """Invalidate the identity guard and refresh when the gray image changes."""
+        self._last_img = None
+        self._on_filter_update()
+
+    def _on_filter_update(self, value: Optional[int] = None):
+        """Update the view when the small objects filter is applied.
+
+        Args:
+            value (Optional[int]): Threshold carried by the spin box signal.
+                Read from the spin box when not provided.
+        """
+        if value is None:
+            value = self.spin_box.get_value()
+
         task = SmallObjectFilterTask(
-            state=self.state, threshold=self.spin_box.get_value()
+            state=self.state, threshold=value, signals=self.task_signals
         )
-        task.signals.finished.connect(self._on_image_ready)
         self.tpool.start(task)
 
     def _on_image_ready(self):
         img = self.state.get_small_objects_img()
-        if img is not None:
-            self.viewer.setImage(self.state.get_midslice(img))
+        if img is None or img is self._last_img:
+            return
+
+        self._last_img = img
+        auto_range = self._slice_buf is None
+        self._slice_buf = _copy_midslice(self.state, img, self._slice_buf)
+        # The slice is a uint8 binary mask; fixed levels let pyqtgraph take
+        # its fast LUT path instead of rescaling on every update.
+        self.viewer.setImage(
+            self._slice_buf, autoLevels=False, levels=(0, 1), autoRange=auto_range
+        )
 
 
 class FilterResults:
@@ -396,7 +468,7 @@ class MultiChannelFilterEditor(QtWidgets.QWidget):
         """
         gray_value = self.gray_filter_editor.slider.get_value()
         small_obj_value = self.small_object_filter_editor.spin_box.get_value()
-        small_obj_img = self.editor_state.get_small_objects_img()
+        small_obj_img = self.editor_state.finalize(gray_value, small_obj_value)
         return FilterResults(
             file_path=self.file_path,
             gray_filter_value=gray_value,
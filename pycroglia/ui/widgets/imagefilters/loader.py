@@ -1,11 +1,11 @@
 from typing import Optional
 
 from PyQt6 import QtWidgets, QtCore
-from pyqtgraph import ImageView
 
 from pycroglia.ui.controllers.ch_editor import MultiChImgEditorState
+from pycroglia.ui.widgets.common.img_viewer import make_minimal_image_view
 from pycroglia.ui.widgets.imagefilters.configurator import MultiChannelConfigurator
-from pycroglia.ui.widgets.imagefilters.tasks import ImageReaderTask
+from pycroglia.ui.widgets.imagefilters.tasks import ImageReaderTask, TaskSignals
 
 
 class MultiChannelImageLoader(QtWidgets.QWidget):
@@ -31,16 +31,14 @@ class MultiChannelImageLoader(QtWidgets.QWidget):
         super().__init__(parent=parent)
 
         self.state = state
-        self.tpool = QtCore.QThreadPool(self)
+        self.tpool = QtCore.QThreadPool.globalInstance()
+        self.task_signals = TaskSignals()
 
         # Widgets
         self.label = QtWidgets.QLabel(parent=self)
         self.label.setText("Image Viewer")
 
-        viewer = ImageView(parent=self)
-        for component in (viewer.ui.histogram, viewer.ui.menuBtn, viewer.ui.roiBtn):
-            component.hide()
-        self.viewer = viewer
+        self.viewer = make_minimal_image_view(parent=self)
 
         self.editor = MultiChannelConfigurator(parent=self)
 
@@ -48,6 +46,7 @@ class MultiChannelImageLoader(QtWidgets.QWidget):
         self.read_button.setText("Read")
 
         # Connections
+        self.task_signals.finished.connect(self._on_image_ready)
         self.read_button.clicked.connect(self._on_read_button_press)
 
         # Layout
@@ -64,8 +63,8 @@ class MultiChannelImageLoader(QtWidgets.QWidget):
             state=self.state,
             ch=self.editor.get_channels(),
             chi=self.editor.get_channel_of_interest(),
+            signals=self.task_signals,
         )
-        task.signals.finished.connect(self._on_image_ready)
         self.tpool.start(task)
 
     def _on_image_ready(self):
@@ -1,10 +1,11 @@
-from pathlib import Path
+from os.path import basename
 from typing import Optional, List
 
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
 from pycroglia.ui.widgets.imagefilters.editors import MultiChannelFilterEditor
 from pycroglia.ui.widgets.imagefilters.results import FilterResults
+from pycroglia.ui.widgets.imagefilters.tasks import FilterResultsTask
 
 
 class FilterEditorStack(QtWidgets.QWidget):
@@ -59,43 +60,135 @@ class FilterEditorStack(QtWidgets.QWidget):
         self.small_objects_filter_label = small_objects_filter_label
         self.small_objects_threshold_label = small_objects_threshold_label
 
+        # Tabs pending materialization, by tab index
+        self._pending: dict[int, str] = {}
+        # Built editors, by tab index
+        self._editors: dict[int, MultiChannelFilterEditor] = {}
+        self._current_files: List[str] = []
+
         # Widgets
         self.tabs = QtWidgets.QTabWidget(self)
 
+        # Connections
+        self.tabs.currentChanged.connect(self._materialize)
+
         # Layout
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.tabs)
-        self.setLayout(layout)
 
     def add_tabs(self, files: List[str]):
         """Clear and add a tab for each file, each with a MultiChannelFilterEditor.
 
+        Editors are expensive to build, so tabs start as lightweight
+        placeholders and the real editor is only constructed when the tab
+        is first shown.
+
         Args:
             files (List[str]): List of file paths to add as tabs.
         """
-        self.tabs.clear()
+        # Re-submitting the same selection (e.g. Back then Next without
+        # changes) keeps the existing tabs and their tuned settings.
+        if files == self._current_files:
+            return
+
+        # Editors already built for files that stay selected are carried
+        # over, so editing the selection doesn't throw away tuned filters.
+        reusable = {
+            self._current_files[i]: editor
+            for i, editor in self._editors.items()
+            if self._current_files[i] in files
+        }
+
+        self._current_files = list(files)
+        self._pending.clear()
+        self._editors.clear()
+
+        self.tabs.blockSignals(True)
+        self.tabs.setUpdatesEnabled(False)
+
+        # Remove in reverse so the tab bar doesn't relayout the remaining
+        # tabs after every removal.
+        for i in range(self.tabs.count() - 1, -1, -1):
+            widget = self.tabs.widget(i)
+            self.tabs.removeTab(i)
+            if widget not in reusable.values():
+                widget.deleteLater()
 
         for file in files:
-            editor = MultiChannelFilterEditor(
-                file,
-                img_viewer_label=self.img_viewer_label,
-                read_button_text=self.read_button_text,
-                channels_label=self.channels_label,
-                channel_of_interest_label=self.channel_of_interest_label,
-                gray_filter_label=self.gray_filter_label,
-                gray_filter_slider_label=self.gray_filter_slider_label,
-                small_objects_filter_label=self.small_objects_filter_label,
-                small_objects_threshold_label=self.small_objects_threshold_label,
-                parent=self,
-            )
-            self.tabs.addTab(editor, f"{Path(file).name}")
+            editor = reusable.get(file)
+            if editor is not None:
+                index = self.tabs.addTab(editor, basename(file))
+                self._editors[index] = editor
+            else:
+                index = self.tabs.addTab(QtWidgets.QWidget(self), basename(file))
+                self._pending[index] = file
 
-    def get_results(self) -> List[FilterResults]:
-        list_of_results = []
+        self.tabs.setUpdatesEnabled(True)
+        self.tabs.blockSignals(False)
+
+        self._materialize(self.tabs.currentIndex())
 
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            if hasattr(editor, "get_filter_results"):
-                list_of_results.append(editor.get_filter_results())
+    def _materialize(self, index: int):
+        """Replace the placeholder at the given index with a real editor.
+
+        Args:
+            index (int): Tab index to materialize.
+        """
+        file = self._pending.pop(index, None)
+        if file is None:
+            return
+
+        editor = MultiChannelFilterEditor(
+            file,
+            img_viewer_label=self.img_viewer_label,
+            read_button_text=self.read_button_text,
+            channels_label=self.channels_label,
+            channel_of_interest_label=self.channel_of_interest_label,
+            gray_filter_label=self.gray_filter_label,
+            gray_filter_slider_label=self.gray_filter_slider_label,
+            small_objects_filter_label=self.small_objects_filter_label,
+            small_objects_threshold_label=self.small_objects_threshold_label,
+            parent=self,
+        )
+
+        name = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, editor, name)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+
+        self._editors[index] = editor
+
+    def get_results(self) -> List[FilterResults]:
+        # Placeholders don't carry results, so everything pending is
+        # materialized first.
+        for index in sorted(self._pending.keys()):
+            self._materialize(index)
+
+        # Every tab is an editor at this point; the index map avoids
+        # probing each tab widget.
+        editors = [self._editors[i] for i in sorted(self._editors.keys())]
+
+        if len(editors) <= 1:
+            return [editor.get_filter_results() for editor in editors]
+
+        # The per-editor pipelines are NumPy work that releases the GIL,
+        # so they are computed in parallel on the thread pool and
+        # gathered before returning.
+        list_of_results: List[Optional[FilterResults]] = [None] * len(editors)
+        semaphore = QtCore.QSemaphore()
+
+        pool = QtCore.QThreadPool.globalInstance()
+        for i, editor in enumerate(editors):
+            pool.start(
+                FilterResultsTask(
+                    index=i,
+                    results=list_of_results,
+                    results_fn=editor.get_filter_results,
+                    semaphore=semaphore,
+                )
+            )
 
+        semaphore.acquire(len(editors))
         return list_of_results
@@ -1,6 +1,9 @@
+from typing import Callable, Optional
+
 from PyQt6 import QtCore
 
 from pycroglia.ui.controllers.ch_editor import MultiChImgEditorState
+from pycroglia.ui.widgets.imagefilters.results import FilterResults
 
 
 class TaskSignals(QtCore.QObject):
@@ -23,20 +26,28 @@ class ImageReaderTask(QtCore.QRunnable):
         signals (TaskSignals): Signals for task completion.
     """
 
-    def __init__(self, state: MultiChImgEditorState, ch: int, chi: int):
+    def __init__(
+        self,
+        state: MultiChImgEditorState,
+        ch: int,
+        chi: int,
+        signals: Optional[TaskSignals] = None,
+    ):
         """Initialize the image reader task.
 
         Args:
             state (MultiChImgEditorState): State object for image editing.
             ch (int): Number of channels.
             chi (int): Channel of interest.
+            signals (Optional[TaskSignals]): Shared signals object. A new one
+                is created when not provided.
         """
         super().__init__()
 
         self.state = state
         self.ch = ch
         self.chi = chi
-        self.signals = TaskSignals()
+        self.signals = signals or TaskSignals()
 
     def run(self):
         """Run the image reading task and emit finished signal."""
@@ -53,18 +64,25 @@ class GrayFilterTask(QtCore.QRunnable):
         signals (TaskSignals): Signals for task completion.
     """
 
-    def __init__(self, state: MultiChImgEditorState, adjust_value: float):
+    def __init__(
+        self,
+        state: MultiChImgEditorState,
+        adjust_value: float,
+        signals: Optional[TaskSignals] = None,
+    ):
         """Initialize the gray filter task.
 
         Args:
             state (MultiChImgEditorState): State object for image editing.
             adjust_value (float): Adjustment value for the gray filter.
+            signals (Optional[TaskSignals]): Shared signals object. A new one
+                is created when not provided.
         """
         super().__init__()
 
         self.state = state
         self.adjust_value = adjust_value
-        self.signals = TaskSignals()
+        self.signals = signals or TaskSignals()
 
     def run(self):
         """Run the gray filter task and emit finished signal."""
@@ -81,20 +99,70 @@ class SmallObjectFilterTask(QtCore.QRunnable):
         signals (TaskSignals): Signals for task completion.
     """
 
-    def __init__(self, state: MultiChImgEditorState, threshold: int):
+    def __init__(
+        self,
+        state: MultiChImgEditorState,
+        threshold: int,
+        signals: Optional[TaskSignals] = None,
+    ):
         """Initialize the small objects filter task.
 
         Args:
             state (MultiChImgEditorState): State object for image editing.
             threshold (int): Minimum object size threshold.
+            signals (Optional[TaskSignals]): Shared signals object. A new one
+                is created when not provided.
         """
         super().__init__()
 
         self.state = state
         self.threshold = threshold
-        self.signals = TaskSignals()
+        self.signals = signals or TaskSignals()
 
     def run(self):
         """Run the small objects filter task and emit finished signal."""
         self.state.apply_small_object_filter(self.threshold)
         self.signals.finished.emit()
+
+
+class FilterResultsTask(QtCore.QRunnable):
+    """QRunnable task for computing one editor's filter results.
+
+    Writes the result into a shared list slot and releases a semaphore,
+    so a caller can gather several editors' results in parallel.
+
+    Attributes:
+        index (int): Slot in the shared results list.
+        results (list): Shared list the result is written into.
+        results_fn (Callable[[], FilterResults]): Produces the results.
+        semaphore (QtCore.QSemaphore): Released once when done.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        results: list,
+        results_fn: Callable[[], FilterResults],
+        semaphore: QtCore.QSemaphore,
+    ):
+        """Initialize the filter results task.
+
+        Args:
+            index (int): Slot in the shared results list.
+            results (list): Shared list the result is written into.
+            results_fn (Callable[[], FilterResults]): Produces the results.
+            semaphore (QtCore.QSemaphore): Released once when done.
+        """
+        super().__init__()
+
+        self.index = index
+        self.results = results
+        self.results_fn = results_fn
+        self.semaphore = semaphore
+
+    def run(self):
+        """Run the results computation and release the semaphore."""
+        try:
+            self.results[self.index] = self.results_fn()
+        finally:
+            self.semaphore.release()
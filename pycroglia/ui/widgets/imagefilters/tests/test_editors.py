@@ -5,6 +5,7 @@ from numpy.typing import NDArray
 from PyQt6 import QtWidgets
 from unittest.mock import MagicMock, patch
 
+from pycroglia.ui.controllers.ch_editor import MultiChImgEditorState
 from pycroglia.ui.widgets.imagefilters.editors import (
     GrayFilterEditor,
     SmallObjectsFilterEditor,
@@ -85,7 +86,7 @@ def test_gray_filter_updates_on_slider(
     with patch.object(
         gray_filter_editor.viewer,
         "setImage",
-        lambda img: setattr(gray_filter_editor.viewer, "image", img),
+        lambda img, **kwargs: setattr(gray_filter_editor.viewer, "image", img),
     ):
 
         def fake_apply_otsu_gray_filter(val):
@@ -113,7 +114,7 @@ def test_small_filter_updates_on_spinbox(
     with patch.object(
         small_objects_filter_editor.viewer,
         "setImage",
-        lambda img: setattr(small_objects_filter_editor.viewer, "image", img),
+        lambda img, **kwargs: setattr(small_objects_filter_editor.viewer, "image", img),
     ):
 
         def fake_apply_small_object_filter(val):
@@ -128,6 +129,45 @@ def test_small_filter_updates_on_spinbox(
     assert hasattr(small_objects_filter_editor.viewer, "image")
 
 
+def test_small_filter_rerenders_on_threshold_change_with_real_state(qtbot):
+    """Test that threshold changes re-render against the real editor state.
+
+    The state reuses output buffers, so this guards against the editor's
+    identity-based re-render elision treating a new result as stale.
+
+    Args:
+        qtbot: pytest-qt bot.
+    """
+    with patch(
+        "pycroglia.ui.controllers.ch_editor.create_channeled_reader",
+        return_value=MagicMock(),
+    ):
+        state = MultiChImgEditorState(file_path="dummy.tif")
+
+    # One 2-voxel component and one 8-voxel component
+    gray_img = np.zeros((2, 4, 4), dtype=np.uint8)
+    gray_img[:, 0, 0] = 1
+    gray_img[:, 2:4, 2:4] = 1
+    state._gray_filtered_img = gray_img
+
+    editor = SmallObjectsFilterEditor(state=state)
+    qtbot.addWidget(editor)
+
+    renders = []
+    with patch.object(
+        editor.viewer,
+        "setImage",
+        lambda img, **kwargs: renders.append(img.copy()),
+    ):
+        state.apply_small_object_filter(1)
+        editor._on_image_ready()
+        state.apply_small_object_filter(5)
+        editor._on_image_ready()
+
+    assert len(renders) == 2
+    assert not np.array_equal(renders[0], renders[1])
+
+
 def test_multichannel_filter_editor_init(qtbot, monkeypatch):
     """Test initialization of MultiChannelFilterEditor and its subwidgets.
 
@@ -174,6 +214,9 @@ def test_multichannel_filter_editor_get_filter_results(qtbot, monkeypatch):
         def get_small_objects_img(self):
             return dummy_img
 
+        def finalize(self, adjust_value, threshold):
+            return dummy_img
+
     monkeypatch.setattr(
         "pycroglia.ui.widgets.imagefilters.editors.MultiChImgEditorState",
         lambda file_path: DummyEditorState(),
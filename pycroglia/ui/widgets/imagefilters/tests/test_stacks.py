@@ -57,25 +57,21 @@ def test_filter_editor_stack_default__init__():
 
 
 @patch("pycroglia.ui.widgets.imagefilters.stacks.MultiChannelFilterEditor")
-def test_filter_editor_stack_add_tabs_creates_editors(
+def test_filter_editor_stack_add_tabs_creates_editors_lazily(
     mock_editor_class, filter_editor_stack
 ):
-    """Test add_tabs creates MultiChannelFilterEditor for each file.
+    """Test add_tabs only builds the editor of the visible tab.
 
     Asserts:
-        Editors are created with correct parameters and added as tabs.
+        Only the current tab's editor is created with correct parameters,
+        and switching tabs materializes the remaining ones.
     """
     files = ["/path/to/file1.tif", "/path/to/file2.tif"]
-    mock_editor1 = Mock()
-    mock_editor2 = Mock()
-    mock_editor_class.side_effect = [mock_editor1, mock_editor2]
-
-    # Mock the tabs.addTab method to avoid Qt call
-    filter_editor_stack.tabs.addTab = Mock()
+    mock_editor_class.side_effect = lambda *args, **kwargs: QtWidgets.QWidget()
 
     filter_editor_stack.add_tabs(files)
 
-    assert mock_editor_class.call_count == 2
+    assert mock_editor_class.call_count == 1
     mock_editor_class.assert_any_call(
         files[0],
         img_viewer_label="Test Viewer",
@@ -89,20 +85,63 @@ def test_filter_editor_stack_add_tabs_creates_editors(
         parent=filter_editor_stack,
     )
 
+    filter_editor_stack.tabs.setCurrentIndex(1)
+
+    assert mock_editor_class.call_count == 2
+    mock_editor_class.assert_any_call(
+        files[1],
+        img_viewer_label="Test Viewer",
+        read_button_text="Load",
+        channels_label="Channels:",
+        channel_of_interest_label="Channel:",
+        gray_filter_label="Gray Filter",
+        gray_filter_slider_label="Threshold:",
+        small_objects_filter_label="Small Objects",
+        small_objects_threshold_label="Min Size:",
+        parent=filter_editor_stack,
+    )
+
 
 def test_filter_editor_stack_add_tabs_clears_existing_tabs(filter_editor_stack):
-    """Test add_tabs clears existing tabs before adding new ones.
+    """Test add_tabs removes existing tabs before adding new ones.
 
     Asserts:
-        Tabs are cleared when adding new files.
+        Only the new files remain as tabs after a second add_tabs call.
     """
-    filter_editor_stack.tabs.clear = Mock()
-    filter_editor_stack.tabs.addTab = Mock()
+    with patch(
+        "pycroglia.ui.widgets.imagefilters.stacks.MultiChannelFilterEditor"
+    ) as mock_editor_class:
+        mock_editor_class.side_effect = lambda *args, **kwargs: QtWidgets.QWidget()
 
-    with patch("pycroglia.ui.widgets.imagefilters.stacks.MultiChannelFilterEditor"):
-        filter_editor_stack.add_tabs(["/path/to/file.tif"])
+        filter_editor_stack.add_tabs(["/path/to/file1.tif", "/path/to/file2.tif"])
+        filter_editor_stack.add_tabs(["/path/to/file3.tif"])
 
-    filter_editor_stack.tabs.clear.assert_called_once()
+    assert filter_editor_stack.tabs.count() == 1
+    assert filter_editor_stack.tabs.tabText(0) == "file3.tif"
+
+
+def test_filter_editor_stack_add_tabs_reuses_editors_for_kept_files(
+    filter_editor_stack,
+):
+    """Test add_tabs keeps built editors for files still in the selection.
+
+    Asserts:
+        The editor built for a kept file is not rebuilt when the file
+        list changes around it.
+    """
+    with patch(
+        "pycroglia.ui.widgets.imagefilters.stacks.MultiChannelFilterEditor"
+    ) as mock_editor_class:
+        mock_editor_class.side_effect = lambda *args, **kwargs: QtWidgets.QWidget()
+
+        filter_editor_stack.add_tabs(["/path/to/file1.tif"])
+        kept_editor = filter_editor_stack.tabs.widget(0)
+
+        filter_editor_stack.add_tabs(["/path/to/file1.tif", "/path/to/file2.tif"])
+
+    assert filter_editor_stack.tabs.count() == 2
+    assert filter_editor_stack.tabs.widget(0) is kept_editor
+    assert mock_editor_class.call_count == 1
 
 
 def test_filter_editor_stack_get_results_returns_filter_results(filter_editor_stack):
@@ -117,15 +156,35 @@ def test_filter_editor_stack_get_results_returns_filter_results(filter_editor_st
     mock_editor2 = Mock()
     mock_editor2.get_filter_results.return_value = Mock(spec=FilterResults)
 
-    filter_editor_stack.tabs.count = Mock(return_value=2)
-    filter_editor_stack.tabs.widget = Mock(side_effect=[mock_editor1, mock_editor2])
-
-    # Mock hasattr to simulate MultiChannelFilterEditor detection
-    with patch("builtins.hasattr") as mock_hasattr:
-        mock_hasattr.return_value = True
+    filter_editor_stack._editors = {0: mock_editor1, 1: mock_editor2}
 
-        results = filter_editor_stack.get_results()
+    results = filter_editor_stack.get_results()
 
     assert len(results) == 2
     mock_editor1.get_filter_results.assert_called_once()
     mock_editor2.get_filter_results.assert_called_once()
+
+
+@patch("pycroglia.ui.widgets.imagefilters.stacks.MultiChannelFilterEditor")
+def test_filter_editor_stack_get_results_materializes_pending_tabs(
+    mock_editor_class, filter_editor_stack
+):
+    """Test get_results builds editors for tabs that were never shown.
+
+    Asserts:
+        All editors exist after get_results, even for unvisited tabs.
+    """
+    files = ["/path/to/file1.tif", "/path/to/file2.tif", "/path/to/file3.tif"]
+
+    def make_editor(*args, **kwargs):
+        editor = QtWidgets.QWidget()
+        editor.get_filter_results = Mock(return_value=Mock(spec=FilterResults))
+        return editor
+
+    mock_editor_class.side_effect = make_editor
+
+    filter_editor_stack.add_tabs(files)
+    filter_editor_stack.get_results()
+
+    assert mock_editor_class.call_count == 3
+    assert not filter_editor_stack._pending
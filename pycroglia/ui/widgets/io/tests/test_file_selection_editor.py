@@ -33,8 +33,9 @@ def test_file_selector_emits_signal(file_selection_editor, qtbot):
         file_selection_editor.file_selector.fileSelected.emit(test_path)
 
     assert file_selection_editor.file_list.model.rowCount() == 1
-    assert file_selection_editor.file_list.model.item(0, 0).text() == ".json"
-    assert file_selection_editor.file_list.model.item(0, 1).text() == test_path
+    model = file_selection_editor.file_list.model
+    assert model.data(model.index(0, 0)) == ".json"
+    assert model.data(model.index(0, 1)) == test_path
 
 
 def test_on_file_added(file_selection_editor, qtbot):
@@ -45,8 +46,9 @@ def test_on_file_added(file_selection_editor, qtbot):
         file_selection_editor._on_file_added(test_path)
 
     assert file_selection_editor.file_list.model.rowCount() == 1
-    assert file_selection_editor.file_list.model.item(0, 0).text() == ".csv"
-    assert file_selection_editor.file_list.model.item(0, 1).text() == test_path
+    model = file_selection_editor.file_list.model
+    assert model.data(model.index(0, 0)) == ".csv"
+    assert model.data(model.index(0, 1)) == test_path
 
 
 def test_on_file_added_empty_path(file_selection_editor):
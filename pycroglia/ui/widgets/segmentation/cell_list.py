@@ -1,29 +1,198 @@
 from typing import Optional, Tuple
 
-from PyQt6 import QtWidgets, QtCore
+import numpy as np
+from numpy.typing import NDArray
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, pyqtSignal
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
 
 from pycroglia.core.labeled_cells import LabeledCells
-from pycroglia.ui.widgets.common.two_column_list import TwoColumnList
 
 
-class CellList(QtWidgets.QWidget):
-    """Widget for displaying and interacting with a list of segmented cells."""
+class CellTableModel(QAbstractTableModel):
+    """Table model backed by NumPy arrays of cell IDs and sizes.
 
-    def __init__(self, headers: list[str], parent: Optional[QtWidgets.QWidget] = None):
+    Rows are stored as two parallel arrays instead of per-row item
+    objects, so a rollback swaps the arrays inside a single model reset
+    rather than tearing down and rebuilding the whole model.
+
+    Attributes:
+        headers (list[str]): Column headers.
+    """
+
+    COLUMN_COUNT: int = 2
+
+    def __init__(self, headers: list[str], parent: Optional[QObject] = None):
+        """Initializes the CellTableModel.
+
+        Args:
+            headers (list[str]): Column headers.
+            parent (Optional[QObject], optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+
+        self.headers = headers
+        self._ids: NDArray = np.empty(0, dtype=np.int64)
+        self._sizes: NDArray = np.empty(0, dtype=np.int64)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Returns the number of rows in the model.
+
+        Args:
+            parent (QModelIndex, optional): Parent index. Defaults to an invalid index.
+
+        Returns:
+            int: Number of cells.
+        """
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Returns the number of columns in the model.
+
+        Args:
+            parent (QModelIndex, optional): Parent index. Defaults to an invalid index.
+
+        Returns:
+            int: Number of columns.
+        """
+        if parent.isValid():
+            return 0
+        return self.COLUMN_COUNT
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Optional[str]:
+        """Returns the display value for the given index.
+
+        Args:
+            index (QModelIndex): Model index.
+            role (int, optional): Item data role. Defaults to DisplayRole.
+
+        Returns:
+            Optional[str]: Cell ID or size as string, or None for other roles.
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        column = self._ids if index.column() == 0 else self._sizes
+        return str(int(column[index.row()]))
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Optional[str]:
+        """Returns the header label for the given section.
+
+        Args:
+            section (int): Column index.
+            orientation (Qt.Orientation): Header orientation.
+            role (int, optional): Item data role. Defaults to DisplayRole.
+
+        Returns:
+            Optional[str]: Header label, or None for other roles.
+        """
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.headers[section]
+        return None
+
+    def set_data(self, ids: NDArray, sizes: NDArray):
+        """Replaces the model contents with the given arrays in one reset.
+
+        Args:
+            ids (NDArray): Cell IDs, one per row.
+            sizes (NDArray): Cell sizes, aligned with ids.
+        """
+        self.beginResetModel()
+        self._ids = ids
+        self._sizes = sizes
+        self.endResetModel()
+
+    def clear(self):
+        """Removes all rows from the model."""
+        self.set_data(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def get_row(self, row: int) -> Tuple[int, int]:
+        """Returns the cell ID and size stored at the given row.
+
+        Args:
+            row (int): Row index.
+
+        Returns:
+            Tuple[int, int]: Tuple of (cell ID, cell size).
+        """
+        return int(self._ids[row]), int(self._sizes[row])
+
+
+class CellList(QWidget):
+    """Widget for displaying and interacting with a list of segmented cells.
+
+    Attributes:
+        table_view (QTableView): Table view widget.
+        model (CellTableModel): NumPy-backed model for the table view.
+        selectionChanged (pyqtSignal): Signal emitted when the selection changes.
+    """
+
+    DEFAULT_HEADER_RESIZE_MODES = [
+        QHeaderView.ResizeMode.ResizeToContents,
+        QHeaderView.ResizeMode.Stretch,
+    ]
+
+    selectionChanged = pyqtSignal()
+
+    def __init__(self, headers: list[str], parent: Optional[QWidget] = None):
         """Initializes the CellList widget.
 
         Args:
             headers (list[str]): List of column headers for the cell list.
-            parent (Optional[QtWidgets.QWidget], optional): Parent widget. Defaults to None.
+            parent (Optional[QWidget], optional): Parent widget. Defaults to None.
         """
         super().__init__(parent=parent)
 
-        # Widgets
-        self.list = TwoColumnList(headers=headers, parent=self)
+        # Selected (id, size), refreshed whenever the selection or the
+        # backing data changes, so selection getters don't re-query the
+        # selection model on every call.
+        self._selected_info: Optional[Tuple[int, int]] = None
+
+        # Table view - Behavior
+        self.table_view = QTableView()
+        self.table_view.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        # Table view - Header
+        header = self.table_view.horizontalHeader()
+        for i, mode in enumerate(self.DEFAULT_HEADER_RESIZE_MODES):
+            header.setSectionResizeMode(i, mode)
+        header.setStretchLastSection(True)
+        self.table_view.verticalHeader().hide()
+
+        # Table model
+        self.model = CellTableModel(headers=headers, parent=self)
+        self.table_view.setModel(self.model)
+
+        # Connections
+        self.table_view.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
+        )
 
         # Layout
-        layout = QtWidgets.QVBoxLayout()
-        layout.addWidget(self.list)
+        layout = QVBoxLayout()
+        layout.addWidget(self.table_view)
 
         # Style
         layout.setContentsMargins(0, 0, 0, 0)
@@ -31,35 +200,25 @@ class CellList(QtWidgets.QWidget):
 
         self.setLayout(layout)
 
-    @property
-    def selectionChanged(self) -> QtCore.pyqtSignal:
-        """Signal emitted when the selection changes in the cell list.
-
-        Returns:
-            QtCore.pyqtSignal: The selectionChanged signal from the underlying list.
-        """
-        return self.list.selectionChanged
-
     def add_cells(self, cells: LabeledCells):
         """Adds cells to the list, sorted by size in descending order.
 
+        Sizes come from the cached per-cell counts and the sort runs in
+        NumPy; the model swaps in the new arrays with a single reset.
+
         Args:
             cells (LabeledCells): LabeledCells object containing cell data.
         """
-        list_of_cells = sorted(
-            [(i, cells.get_cell_size(i)) for i in range(1, cells.len() + 1)],
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        sizes = cells.get_sizes()
+        order = np.argsort(-sizes, kind="stable")
 
-        for cell in list_of_cells:
-            self.list.add_item(str(cell[0]), str(cell[1]))
+        self._selected_info = None
+        self.model.set_data(order + 1, sizes[order])
 
     def clear_cells(self):
-        """Clears all cells from the list and resets the headers."""
-        self.list.model.clear()
-        self.list.model.setHorizontalHeaderLabels(self.list.headers)
-        self.list.dataChanged.emit()
+        """Clears all cells from the list."""
+        self._selected_info = None
+        self.model.clear()
 
     def get_selected_cell_id(self) -> Optional[int]:
         """Gets the ID of the currently selected cell.
@@ -67,9 +226,9 @@ class CellList(QtWidgets.QWidget):
         Returns:
             Optional[int]: The selected cell's ID, or None if no cell is selected.
         """
-        selected = self.list.get_selected_item()
-        if selected:
-            return int(selected[0])
+        info = self.get_selected_cell_info()
+        if info:
+            return info[0]
         return None
 
     def get_selected_cell_info(self) -> Optional[Tuple[int, int]]:
@@ -78,7 +237,10 @@ class CellList(QtWidgets.QWidget):
         Returns:
             Optional[Tuple[int, int]]: Tuple of (cell ID, cell size), or None if no cell is selected.
         """
-        selected = self.list.get_selected_item()
-        if selected:
-            return int(selected[0]), int(selected[1])
-        return None
+        return self._selected_info
+
+    def _on_selection_changed(self):
+        """Caches the selected row and emits the selectionChanged signal."""
+        indexes = self.table_view.selectionModel().selectedRows()
+        self._selected_info = self.model.get_row(indexes[0].row()) if indexes else None
+        self.selectionChanged.emit()
@@ -1,33 +1,85 @@
 from typing import Optional
 
 import numpy as np
-from PyQt6 import QtWidgets
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
 
 from pycroglia.core.labeled_cells import LabeledCells
 from pycroglia.ui.widgets.common.img_viewer import CustomImageViewer
 
 
-class MultiCellImageViewer(QtWidgets.QWidget):
+class MultiCellImageViewer(QWidget):
     """Widget for displaying a 2D projection of labeled cells with unique colors."""
 
     DEFAULT_RGB_SEED: int = 42
+    LUT_MIN_SIZE: int = 1024
 
-    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+    def __init__(self, parent: Optional[QWidget] = None):
         """Initializes the MultiCellImageViewer widget.
 
         Args:
-            parent (Optional[QtWidgets.QWidget], optional): Parent widget. Defaults to None.
+            parent (Optional[QWidget], optional): Parent widget. Defaults to None.
         """
         super().__init__(parent=parent)
 
+        self._lut: Optional[np.ndarray] = None
+        self._lut_seed: Optional[int] = None
+        self._lut_filled: int = 0
+        self._rng: Optional[np.random.Generator] = None
+
         # Widgets
         self.img_viewer = CustomImageViewer(parent=self)
 
         # Layout
-        layout = QtWidgets.QVBoxLayout()
+        layout = QVBoxLayout()
         layout.addWidget(self.img_viewer)
         self.setLayout(layout)
 
+    def _get_lut(self, n_cells: int, rgb_seed: int) -> np.ndarray:
+        """Returns a color lookup table for the given number of cells.
+
+        The table is a persistent buffer sized to a high-water mark and
+        grown geometrically; colors for rows that already exist are kept
+        (the generator stream continues where it left off), so after the
+        first call only the rows for new cells are drawn. The buffer is
+        only reset when the seed changes.
+
+        Args:
+            n_cells (int): Number of labeled cells.
+            rgb_seed (int): Seed for random color generation.
+
+        Returns:
+            np.ndarray: (n_cells + 1, 4) RGBA lookup table.
+        """
+        if self._lut is None or self._lut_seed != rgb_seed:
+            self._rng = np.random.Generator(np.random.Philox(rgb_seed))
+            self._lut = np.zeros(
+                (max(n_cells + 1, self.LUT_MIN_SIZE), 4), dtype=np.uint8
+            )
+            self._lut[:, 3] = 255
+            self._lut_seed = rgb_seed
+            # Row 0 (background) stays black
+            self._lut_filled = 1
+
+        if n_cells + 1 > self._lut.shape[0]:
+            grown = np.zeros(
+                (max(n_cells + 1, 2 * self._lut.shape[0]), 4), dtype=np.uint8
+            )
+            grown[:, 3] = 255
+            grown[: self._lut_filled] = self._lut[: self._lut_filled]
+            self._lut = grown
+
+        if n_cells + 1 > self._lut_filled:
+            # Colors want raw uint8 noise, so the rows are filled from
+            # the generator's byte stream instead of the bounded-integer
+            # sampling path.
+            new_rows = n_cells + 1 - self._lut_filled
+            self._lut[self._lut_filled : n_cells + 1, :3] = np.frombuffer(
+                self._rng.bytes(new_rows * 3), dtype=np.uint8
+            ).reshape(new_rows, 3)
+            self._lut_filled = n_cells + 1
+
+        return self._lut[: n_cells + 1]
+
     def set_cells_img(self, cells: LabeledCells, rgb_seed: int = DEFAULT_RGB_SEED):
         """Displays a 2D projection of labeled cells, assigning a unique color to each cell.
 
@@ -38,16 +90,14 @@ class MultiCellImageViewer(QtWidgets.QWidget):
         label_2d = cells.labels_to_2d()
         n_cells = cells.len()
 
-        rng = np.random.default_rng(rgb_seed)
-        lut = np.zeros((n_cells + 1, 4), dtype=np.uint8)
-        lut[0] = (0, 0, 0, 255)
-        lut[1:] = np.concatenate(
-            [
-                rng.integers(0, 256, size=(n_cells, 3), dtype=np.uint8),
-                np.full((n_cells, 1), 255, dtype=np.uint8),
-            ],
-            axis=1,
-        )
+        # A compact integer raster with fixed levels lets pyqtgraph map
+        # labels straight through the LUT, without a per-redraw
+        # autoLevels scan or float rescaling pass.
+        label_dtype = np.uint8 if n_cells <= 255 else np.uint16
+        if label_2d.dtype != label_dtype:
+            label_2d = label_2d.astype(label_dtype)
 
-        self.img_viewer.set_image(label_2d)
-        self.img_viewer.set_lookup_table(lut)
+        self.img_viewer.set_image(
+            label_2d, autoLevels=False, levels=(0, max(n_cells, 1))
+        )
+        self.img_viewer.set_lookup_table(self._get_lut(n_cells, rgb_seed))
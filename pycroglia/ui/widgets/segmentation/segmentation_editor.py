@@ -1,16 +1,29 @@
 from typing import Optional
 
-from PyQt6 import QtWidgets
+from PyQt6.QtCore import QThreadPool, QTimer
+from PyQt6.QtWidgets import (
+    QHBoxLayout,
+    QProgressDialog,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
 from numpy.typing import NDArray
 
 from pycroglia.core.labeled_cells import LabelingStrategy
 from pycroglia.ui.widgets.common.img_viewer import CustomImageViewer
 from pycroglia.ui.widgets.segmentation.cell_list import CellList
 from pycroglia.ui.widgets.segmentation.multi_cell_img_viewer import MultiCellImageViewer
+from pycroglia.ui.widgets.segmentation.tasks import (
+    BuildStateSignals,
+    BuildStateTask,
+    SegmentCellTask,
+    SegmentationTaskSignals,
+)
 from pycroglia.ui.controllers.segmentation_state import SegmentationEditorState
 
 
-class SegmentationEditor(QtWidgets.QWidget):
+class SegmentationEditor(QWidget):
     """Widget for interactive cell segmentation editing.
 
     Provides a UI for visualizing, segmenting, and rolling back cell segmentations.
@@ -28,6 +41,10 @@ class SegmentationEditor(QtWidgets.QWidget):
     DEFAULT_PROGRESS_MAX = 100
     DEFAULT_PROGRESS_MIN = 0
 
+    # Delay used to coalesce rapid selection changes (e.g. holding an
+    # arrow key) into a single cell render
+    SELECTION_DEBOUNCE_MS = 30
+
     # Layout Constants
     LIST_STRETCH_FACTOR = 1
     VIEWER_STRETCH_FACTOR = 2
@@ -43,7 +60,7 @@ class SegmentationEditor(QtWidgets.QWidget):
         segmentation_button_text: Optional[str] = None,
         progress_title: Optional[str] = None,
         progress_cancel_text: Optional[str] = None,
-        parent: Optional[QtWidgets.QWidget] = None,
+        parent: Optional[QWidget] = None,
     ):
         """Initializes the SegmentationEditor widget.
 
@@ -57,7 +74,7 @@ class SegmentationEditor(QtWidgets.QWidget):
             segmentation_button_text (Optional[str], optional): Text for the segmentation button.
             progress_title (Optional[str], optional): Title for the progress dialog.
             progress_cancel_text (Optional[str], optional): Cancel button text for progress dialog.
-            parent (Optional[QtWidgets.QWidget], optional): Parent widget.
+            parent (Optional[QWidget], optional): Parent widget.
         """
         super().__init__(parent=parent)
 
@@ -74,16 +91,40 @@ class SegmentationEditor(QtWidgets.QWidget):
             progress_cancel_text or self.DEFAULT_PROGRESS_CANCEL_TEXT
         )
 
-        self.state = SegmentationEditorState(img, labeling_strategy, min_size)
+        # State construction runs connected-component labeling, so it is
+        # deferred to initialize() / the first showEvent.
+        self.state: Optional[SegmentationEditorState] = None
+        self._init_args = (img, labeling_strategy, min_size)
+        self._initialized = False
+        self._dirty = False
+        self._last_selected: Optional[int] = None
         self.with_progress_bar = with_progress_bar
 
+        self.tpool = QThreadPool.globalInstance()
+        self.task_signals = SegmentationTaskSignals()
+        self._state_signals = BuildStateSignals()
+        self._progress_bar: Optional[QProgressDialog] = None
+
+        # Coalesces bursts of stateChanged emissions into one refresh
+        # per event-loop iteration.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._load_data)
+
+        # Coalesces bursts of selection changes into one cell render
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(self.SELECTION_DEBOUNCE_MS)
+        self._selection_timer.timeout.connect(self._render_selected_cell)
+
         # Widgets
         self.list = CellList(headers=self.headers_text, parent=self)
 
-        self.segment_button = QtWidgets.QPushButton(self.segmentation_button_text)
+        self.segment_button = QPushButton(self.segmentation_button_text)
         self.segment_button.setEnabled(False)
 
-        self.rollback_button = QtWidgets.QPushButton(self.rollback_button_text)
+        self.rollback_button = QPushButton(self.rollback_button_text)
         self.rollback_button.setEnabled(False)
 
         self.multi_cell_viewer = MultiCellImageViewer(parent=self)
@@ -93,37 +134,99 @@ class SegmentationEditor(QtWidgets.QWidget):
         self.list.selectionChanged.connect(self._on_cell_selection_changed)
         self.segment_button.clicked.connect(self._on_cell_segmentation_request)
         self.rollback_button.clicked.connect(self._on_rollback_request)
-        self.state.stateChanged.connect(self._load_data)
+        self.task_signals.progress.connect(self._on_segmentation_progress)
+        self.task_signals.finished.connect(self._on_segmentation_done)
+        self._state_signals.ready.connect(self._on_state_ready)
 
         # Layout
-        list_layout = QtWidgets.QVBoxLayout()
+        list_layout = QVBoxLayout()
         list_layout.addWidget(self.list, stretch=self.LIST_STRETCH_FACTOR)
         list_layout.addWidget(self.segment_button)
         list_layout.addWidget(self.rollback_button)
-        list_container = QtWidgets.QWidget()
+        list_container = QWidget()
         list_container.setLayout(list_layout)
 
-        layout = QtWidgets.QHBoxLayout()
+        layout = QHBoxLayout()
         layout.addWidget(list_container, stretch=self.LIST_STRETCH_FACTOR)
         layout.addWidget(self.multi_cell_viewer, stretch=self.VIEWER_STRETCH_FACTOR)
 
         # For consistency
         # TODO - Improve style
-        cell_viewer_layout = QtWidgets.QVBoxLayout()
+        cell_viewer_layout = QVBoxLayout()
         cell_viewer_layout.addWidget(self.cell_viewer)
-        cell_viewer_container = QtWidgets.QWidget()
+        cell_viewer_container = QWidget()
         cell_viewer_container.setLayout(cell_viewer_layout)
         layout.addWidget(cell_viewer_container, stretch=self.VIEWER_STRETCH_FACTOR)
 
         self.setLayout(layout)
 
-        # Loads data
+    def initialize(self):
+        """Starts building the segmentation state on the thread pool.
+
+        Labeling only runs once; subsequent calls are no-ops. Called from
+        the first showEvent so hidden editors (e.g. background tabs) don't
+        pay for labeling until they are actually viewed. The build runs on
+        a worker so the GUI stays responsive; the UI is populated when the
+        state arrives through _on_state_ready.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
+
+        img, labeling_strategy, min_size = self._init_args
+        self.tpool.start(
+            BuildStateTask(
+                img, labeling_strategy, min_size, signals=self._state_signals
+            )
+        )
+
+    def _on_state_ready(self, state: SegmentationEditorState):
+        """Adopts the state built by the worker and loads it into the UI.
+
+        Args:
+            state (SegmentationEditorState): Freshly built segmentation state.
+        """
+        self.state = state
+        self.state.stateChanged.connect(self._refresh_timer.start)
         self._load_data()
 
+    def showEvent(self, event):
+        """Initializes the editor the first time it becomes visible.
+
+        Also flushes any refresh that was skipped while the editor was
+        hidden, so off-screen state changes coalesce into one reload.
+
+        Args:
+            event (QtGui.QShowEvent): Qt show event.
+        """
+        super().showEvent(event)
+        self.initialize()
+
+        if self._dirty:
+            self._dirty = False
+            self._load_data()
+
     def _load_data(self):
-        """Loads and displays the current segmentation state in the UI."""
+        """Loads and displays the current segmentation state in the UI.
+
+        Deferred while the editor is hidden: repeated state changes on a
+        background tab mark the editor dirty and are applied in a single
+        refresh on the next showEvent.
+        """
+        if self.state is None:
+            return
+
+        if not self.isVisible():
+            self._dirty = True
+            return
+
         actual_state = self.state.get_state()
 
+        # Reloading re-labels the cells, so a previously rendered cell id
+        # now names a different cell; drop the render guard so the next
+        # selection is rendered even if it reuses the same id.
+        self._last_selected = None
+
         self.list.clear_cells()
         self.list.add_cells(actual_state)
         self.multi_cell_viewer.set_cells_img(actual_state)
@@ -131,39 +234,94 @@ class SegmentationEditor(QtWidgets.QWidget):
         self.rollback_button.setEnabled(self.state.has_prev_state())
 
     def _on_cell_selection_changed(self):
-        """Handles cell selection changes in the list and updates the cell viewer."""
+        """Handles cell selection changes in the list.
+
+        The segment button tracks the selection immediately; the cell
+        viewer update is debounced so holding an arrow key only renders
+        the row the selection lands on.
+        """
         selected_cell = self.list.get_selected_cell_id()
         self.segment_button.setEnabled(selected_cell is not None)
         if selected_cell is None:
+            self._last_selected = None
+            return
+
+        self._selection_timer.start()
+
+    def _render_selected_cell(self):
+        """Renders the 2D projection of the cell selected at fire time."""
+        selected_cell = self.list.get_selected_cell_id()
+        if selected_cell is None:
+            return
+
+        # Re-selecting the same row doesn't change the viewer
+        if selected_cell == self._last_selected:
             return
+        self._last_selected = selected_cell
 
         cell_2d = self.state.get_state().cell_to_2d(selected_cell)
         self.cell_viewer.set_image(cell_2d)
 
     def _on_cell_segmentation_request(self):
-        """Handles the segmentation request for the selected cell, showing a progress bar if enabled."""
+        """Handles the segmentation request for the selected cell.
+
+        The segmentation runs on a worker thread so the GUI (and the
+        progress dialog, if enabled) stays responsive.
+        """
         selected_cell_info = self.list.get_selected_cell_info()
         if selected_cell_info is None:
             return
 
-        progress_bar = None
+        self.segment_button.setEnabled(False)
+        self.rollback_button.setEnabled(False)
+
+        task = SegmentCellTask(
+            state=self.state,
+            cell_index=selected_cell_info[0],
+            cell_size=selected_cell_info[1],
+            signals=self.task_signals,
+        )
+
         if self.with_progress_bar:
-            progress_bar = QtWidgets.QProgressDialog(
+            self._progress_bar = QProgressDialog(
                 self.progress_title,
                 self.progress_cancel_text,
                 self.DEFAULT_PROGRESS_MIN,
                 self.DEFAULT_PROGRESS_MAX,
             )
-            progress_bar.setModal(True)
-            progress_bar.show()
-
-        try:
-            self.state.segment_cell(
-                selected_cell_info[0], selected_cell_info[1], progress_bar
+            self._progress_bar.setModal(True)
+            self._progress_bar.setLabelText(
+                SegmentationEditorState.DEFAULT_PROGRESS_BAR_TEXT
             )
-        finally:
-            if progress_bar:
-                progress_bar.close()
+            self._progress_bar.canceled.connect(task.cancel)
+            self._progress_bar.show()
+
+        self.tpool.start(task)
+
+    def _on_segmentation_progress(self, current: int, total: int):
+        """Updates the progress dialog from worker progress signals.
+
+        Args:
+            current (int): Current cell being processed.
+            total (int): Total number of cells.
+        """
+        if self._progress_bar is None:
+            return
+
+        self._progress_bar.setMaximum(total)
+        self._progress_bar.setValue(current)
+        self._progress_bar.setLabelText(
+            SegmentationEditorState.DEFAULT_PROGRESS_BAR_TEXT_GENERATOR(current, total)
+        )
+
+    def _on_segmentation_done(self):
+        """Closes the progress dialog and restores the buttons when the worker finishes."""
+        if self._progress_bar is not None:
+            self._progress_bar.close()
+            self._progress_bar = None
+
+        self.segment_button.setEnabled(self.list.get_selected_cell_id() is not None)
+        self.rollback_button.setEnabled(self.state.has_prev_state())
 
     def _on_rollback_request(self):
         """Handles the rollback request to restore the previous segmentation state."""
@@ -1,7 +1,7 @@
-from pathlib import Path
+from os.path import basename
 from typing import Optional
 
-from PyQt6 import QtWidgets
+from PyQt6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
 
 from pycroglia.core.enums import SkimageCellConnectivity
 from pycroglia.core.labeled_cells import SkimageImgLabeling
@@ -9,11 +9,11 @@ from pycroglia.ui.widgets.imagefilters.results import FilterResults
 from pycroglia.ui.widgets.segmentation.segmentation_editor import SegmentationEditor
 
 
-class SegmentationEditorStack(QtWidgets.QWidget):
+class SegmentationEditorStack(QWidget):
     """Widget that manages a tabbed interface for segmentation editors.
 
     Attributes:
-        tabs (QtWidgets.QTabWidget): Tab widget containing segmentation editors.
+        tabs (QTabWidget): Tab widget containing segmentation editors.
         headers_text (Optional[list[str]]): Text for cell list headers.
         rollback_button_text (Optional[str]): Text for rollback button.
         segmentation_button_text (Optional[str]): Text for segmentation button.
@@ -28,7 +28,7 @@ class SegmentationEditorStack(QtWidgets.QWidget):
         segmentation_button_text: Optional[str] = None,
         progress_title: Optional[str] = None,
         progress_cancel_text: Optional[str] = None,
-        parent: Optional[QtWidgets.QWidget] = None,
+        parent: Optional[QWidget] = None,
     ):
         """Initialize the SegmentationEditorStack widget.
 
@@ -38,7 +38,7 @@ class SegmentationEditorStack(QtWidgets.QWidget):
             segmentation_button_text (Optional[str]): Text for segmentation button.
             progress_title (Optional[str]): Title for progress dialog.
             progress_cancel_text (Optional[str]): Text for progress cancel button.
-            parent (Optional[QtWidgets.QWidget]): Parent widget.
+            parent (Optional[QWidget]): Parent widget.
         """
         super().__init__(parent=parent)
 
@@ -49,33 +49,108 @@ class SegmentationEditorStack(QtWidgets.QWidget):
         self.progress_title = progress_title
         self.progress_cancel_text = progress_cancel_text
 
+        # Tabs pending materialization, by tab index
+        self._pending: dict[int, FilterResults] = {}
+        self._current_keys: list[tuple] = []
+
         # Widgets
-        self.tabs = QtWidgets.QTabWidget(self)
+        self.tabs = QTabWidget(self)
+
+        # Connections
+        self.tabs.currentChanged.connect(self._materialize)
 
         # Layout
-        layout = QtWidgets.QVBoxLayout(self)
+        layout = QVBoxLayout(self)
         layout.addWidget(self.tabs)
-        self.setLayout(layout)
 
     def add_tabs(self, results: list[FilterResults]):
         """Clear and add a tab for each result, each with a SegmentationEditor.
 
+        Editors run cell labeling when built, so tabs start as lightweight
+        placeholders and the real editor is only constructed when the tab
+        is first shown.
+
         Args:
             results (list[FilterResults]): List of filter results to add as tabs.
         """
-        self.tabs.clear()
-
-        for elem in results:
-            editor = SegmentationEditor(
-                img=elem.small_object_filtered_img,
-                labeling_strategy=SkimageImgLabeling(SkimageCellConnectivity.CORNERS),
-                min_size=elem.min_size,
-                with_progress_bar=True,
-                headers=self.headers_text,
-                rollback_button_text=self.rollback_button_text,
-                segmentation_button_text=self.segmentation_button_text,
-                progress_title=self.progress_title,
-                progress_cancel_text=self.progress_cancel_text,
-                parent=self,
+        # Re-submitting unchanged filter results (e.g. Back then Next
+        # without retuning) keeps the existing editors and their
+        # segmentation history. The filtered image is compared by
+        # identity; unchanged filter runs reuse the same array.
+        keys = [
+            (
+                elem.file_path,
+                elem.gray_filter_value,
+                elem.min_size,
+                id(elem.small_object_filtered_img),
             )
-            self.tabs.addTab(editor, f"{Path(elem.file_path).name}")
+            for elem in results
+        ]
+        if keys == self._current_keys:
+            return
+
+        # Editors already built for results that are unchanged in the new
+        # submission are carried over, so a partial retune doesn't throw
+        # away the other tabs' segmentation history.
+        reusable = {
+            self._current_keys[i]: self.tabs.widget(i)
+            for i in range(self.tabs.count())
+            if i not in self._pending and self._current_keys[i] in keys
+        }
+
+        self._current_keys = keys
+        self._pending.clear()
+
+        self.tabs.blockSignals(True)
+        self.tabs.setUpdatesEnabled(False)
+
+        # Remove in reverse so the tab bar doesn't relayout the remaining
+        # tabs after every removal.
+        for i in range(self.tabs.count() - 1, -1, -1):
+            widget = self.tabs.widget(i)
+            self.tabs.removeTab(i)
+            if widget not in reusable.values():
+                widget.deleteLater()
+
+        for key, elem in zip(keys, results):
+            editor = reusable.get(key)
+            if editor is not None:
+                self.tabs.addTab(editor, basename(elem.file_path))
+            else:
+                index = self.tabs.addTab(QWidget(self), basename(elem.file_path))
+                self._pending[index] = elem
+
+        self.tabs.setUpdatesEnabled(True)
+        self.tabs.blockSignals(False)
+
+        self._materialize(self.tabs.currentIndex())
+
+    def _materialize(self, index: int):
+        """Replace the placeholder at the given index with a real editor.
+
+        Args:
+            index (int): Tab index to materialize.
+        """
+        elem = self._pending.pop(index, None)
+        if elem is None:
+            return
+
+        editor = SegmentationEditor(
+            img=elem.small_object_filtered_img,
+            labeling_strategy=SkimageImgLabeling(SkimageCellConnectivity.CORNERS),
+            min_size=elem.min_size,
+            with_progress_bar=True,
+            headers=self.headers_text,
+            rollback_button_text=self.rollback_button_text,
+            segmentation_button_text=self.segmentation_button_text,
+            progress_title=self.progress_title,
+            progress_cancel_text=self.progress_cancel_text,
+            parent=self,
+        )
+
+        name = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, editor, name)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
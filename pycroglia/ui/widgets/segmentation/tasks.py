@@ -0,0 +1,136 @@
+from typing import Optional
+
+from PyQt6.QtCore import QCoreApplication, QObject, QRunnable, pyqtSignal
+from numpy.typing import NDArray
+
+from pycroglia.core.labeled_cells import LabelingStrategy
+from pycroglia.ui.controllers.segmentation_state import SegmentationEditorState
+
+
+class BuildStateSignals(QObject):
+    """Signals for state construction tasks.
+
+    Attributes:
+        ready (pyqtSignal): Signal emitted with the built state.
+    """
+
+    ready = pyqtSignal(object)
+
+
+class BuildStateTask(QRunnable):
+    """QRunnable task that builds the segmentation state off-thread.
+
+    Labeling a volume is the expensive part of opening an editor; running
+    it on the thread pool keeps the GUI responsive while the editor
+    initializes.
+
+    Attributes:
+        img (NDArray): 3D binary image to label.
+        labeling_strategy (LabelingStrategy): Strategy for labeling connected components.
+        min_size (int): Minimum size for objects to keep after noise removal.
+        signals (BuildStateSignals): Signals for task completion.
+    """
+
+    def __init__(
+        self,
+        img: NDArray,
+        labeling_strategy: LabelingStrategy,
+        min_size: int,
+        signals: Optional[BuildStateSignals] = None,
+    ):
+        """Initialize the state construction task.
+
+        Args:
+            img (NDArray): 3D binary image to label.
+            labeling_strategy (LabelingStrategy): Strategy for labeling connected components.
+            min_size (int): Minimum size for objects to keep after noise removal.
+            signals (Optional[BuildStateSignals]): Shared signals object.
+                A new one is created when not provided.
+        """
+        super().__init__()
+
+        self.img = img
+        self.labeling_strategy = labeling_strategy
+        self.min_size = min_size
+        self.signals = signals or BuildStateSignals()
+
+    def run(self):
+        """Build the segmentation state and emit it through ready."""
+        state = SegmentationEditorState(self.img, self.labeling_strategy, self.min_size)
+
+        # The state is born with this worker thread's affinity; hand it
+        # to the GUI thread so it can be owned and deleted there safely.
+        app = QCoreApplication.instance()
+        if app is not None:
+            state.moveToThread(app.thread())
+
+        self.signals.ready.emit(state)
+
+
+class SegmentationTaskSignals(QObject):
+    """Signals for segmentation QRunnable tasks.
+
+    Attributes:
+        progress (pyqtSignal): Signal emitted with (current, total) while processing.
+        finished (pyqtSignal): Signal emitted when the task is finished.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+
+
+class SegmentCellTask(QRunnable):
+    """QRunnable task for segmenting a cell asynchronously.
+
+    Attributes:
+        state (SegmentationEditorState): State object for segmentation editing.
+        cell_index (int): Index of the cell to segment.
+        cell_size (int): Minimum size for segmentation.
+        signals (SegmentationTaskSignals): Signals for task progress and completion.
+    """
+
+    def __init__(
+        self,
+        state: SegmentationEditorState,
+        cell_index: int,
+        cell_size: int,
+        signals: Optional[SegmentationTaskSignals] = None,
+    ):
+        """Initialize the cell segmentation task.
+
+        Args:
+            state (SegmentationEditorState): State object for segmentation editing.
+            cell_index (int): Index of the cell to segment.
+            cell_size (int): Minimum size for segmentation.
+            signals (Optional[SegmentationTaskSignals]): Shared signals object.
+                A new one is created when not provided.
+        """
+        super().__init__()
+
+        self.state = state
+        self.cell_index = cell_index
+        self.cell_size = cell_size
+        self.signals = signals or SegmentationTaskSignals()
+        self._canceled = False
+
+    def cancel(self):
+        """Request cancellation; polled between cells while running."""
+        self._canceled = True
+
+    def _was_canceled(self) -> bool:
+        """Return whether cancellation was requested.
+
+        Returns:
+            bool: True if cancel() was called.
+        """
+        return self._canceled
+
+    def run(self):
+        """Run the segmentation task and emit finished signal."""
+        self.state.segment_cell(
+            self.cell_index,
+            self.cell_size,
+            progress_cb=self.signals.progress.emit,
+            cancel_cb=self._was_canceled,
+        )
+        self.signals.finished.emit()
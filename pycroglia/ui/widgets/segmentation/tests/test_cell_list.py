@@ -29,9 +29,9 @@ def cell_list(qtbot):
 def test_add_cells(cell_list, labeled_cells_simple):
     """Test adding cells to the list."""
     cell_list.add_cells(labeled_cells_simple)
-    assert cell_list.list.model.rowCount() == 2
+    assert cell_list.model.rowCount() == 2
 
-    sizes = [int(cell_list.list.model.item(i, 1).text()) for i in range(2)]
+    sizes = [int(cell_list.model.data(cell_list.model.index(i, 1))) for i in range(2)]
     assert sizes == sorted(sizes, reverse=True)
 
 
@@ -39,29 +39,27 @@ def test_clear_cells(cell_list, labeled_cells_simple):
     """Test clearing cells from the list."""
     cell_list.add_cells(labeled_cells_simple)
     cell_list.clear_cells()
-    assert cell_list.list.model.rowCount() == 0
+    assert cell_list.model.rowCount() == 0
 
 
 def test_get_selected_cell_id(cell_list, labeled_cells_simple):
     """Test getting selected cell id."""
     cell_list.add_cells(labeled_cells_simple)
 
-    index = cell_list.list.model.index(0, 0)
-    cell_list.list.table_view.selectRow(index.row())
-    assert cell_list.get_selected_cell_id() == int(
-        cell_list.list.model.item(0, 0).text()
-    )
+    index = cell_list.model.index(0, 0)
+    cell_list.table_view.selectRow(index.row())
+    assert cell_list.get_selected_cell_id() == int(cell_list.model.data(index))
 
 
 def test_get_selected_cell_info(cell_list, labeled_cells_simple):
     """Test getting selected cell info."""
     cell_list.add_cells(labeled_cells_simple)
 
-    index = cell_list.list.model.index(0, 0)
-    cell_list.list.table_view.selectRow(index.row())
+    index = cell_list.model.index(0, 0)
+    cell_list.table_view.selectRow(index.row())
     info = cell_list.get_selected_cell_info()
-    assert info[0] == int(cell_list.list.model.item(0, 0).text())
-    assert info[1] == int(cell_list.list.model.item(0, 1).text())
+    assert info[0] == int(cell_list.model.data(cell_list.model.index(0, 0)))
+    assert info[1] == int(cell_list.model.data(cell_list.model.index(0, 1)))
 
 
 def test_get_selected_cell_id_none(cell_list):
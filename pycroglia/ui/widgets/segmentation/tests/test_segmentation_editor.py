@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 
 from pycroglia.ui.widgets.segmentation.segmentation_editor import SegmentationEditor
+from pycroglia.ui.controllers.segmentation_state import SegmentationEditorState
 from pycroglia.core.labeled_cells import LabeledCells, SkimageImgLabeling
 from pycroglia.core.enums import SkimageCellConnectivity
 
@@ -25,21 +26,27 @@ def segmentation_editor(qtbot, labeled_cells_simple):
     labeling_strategy = SkimageImgLabeling(SkimageCellConnectivity.EDGES)
     widget = SegmentationEditor(img, labeling_strategy, min_size=1)
     qtbot.addWidget(widget)
+
+    # The editor normally builds its state on the thread pool; tests
+    # inject a synchronously built state so they stay deterministic.
+    widget._initialized = True
+    widget.show()
+    widget._on_state_ready(SegmentationEditorState(img, labeling_strategy, 1))
     return widget
 
 
 def test_load_data_populates_list(segmentation_editor):
     """Test that _load_data populates the cell list."""
     segmentation_editor._load_data()
-    assert segmentation_editor.list.list.model.rowCount() > 0
+    assert segmentation_editor.list.model.rowCount() > 0
 
 
 def test_on_cell_selection_enables_segment_button(segmentation_editor, qtbot):
     """Test that selecting a cell enables the segment button."""
     segmentation_editor._load_data()
 
-    index = segmentation_editor.list.list.model.index(0, 0)
-    segmentation_editor.list.list.table_view.selectRow(index.row())
+    index = segmentation_editor.list.model.index(0, 0)
+    segmentation_editor.list.table_view.selectRow(index.row())
     segmentation_editor._on_cell_selection_changed()
 
     assert segmentation_editor.segment_button.isEnabled()
@@ -49,10 +56,14 @@ def test_on_cell_selection_updates_cell_viewer(segmentation_editor, qtbot):
     """Test that selecting a cell updates the cell viewer image."""
     segmentation_editor._load_data()
 
-    index = segmentation_editor.list.list.model.index(0, 0)
-    segmentation_editor.list.list.table_view.selectRow(index.row())
+    index = segmentation_editor.list.model.index(0, 0)
+    segmentation_editor.list.table_view.selectRow(index.row())
     segmentation_editor._on_cell_selection_changed()
 
+    # Selection changes arm the debounce timer; fire the render directly
+    assert segmentation_editor._selection_timer.isActive()
+    segmentation_editor._render_selected_cell()
+
     assert segmentation_editor.cell_viewer.img_viewer.image is not None
 
 
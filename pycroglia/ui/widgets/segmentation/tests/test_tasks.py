@@ -0,0 +1,42 @@
+import pytest
+from unittest.mock import MagicMock
+from pycroglia.ui.widgets.segmentation.tasks import (
+    SegmentationTaskSignals,
+    SegmentCellTask,
+)
+
+
+@pytest.fixture
+def mock_segmentation_state():
+    state = MagicMock()
+    return state
+
+
+def test_segmentation_task_signals_initialization():
+    signals = SegmentationTaskSignals()
+    assert hasattr(signals, "progress")
+    assert hasattr(signals, "finished")
+
+
+def test_segment_cell_task_initialization(mock_segmentation_state):
+    task = SegmentCellTask(state=mock_segmentation_state, cell_index=2, cell_size=50)
+    assert task.state == mock_segmentation_state
+    assert task.cell_index == 2
+    assert task.cell_size == 50
+
+
+def test_segment_cell_task_cancel(mock_segmentation_state):
+    task = SegmentCellTask(state=mock_segmentation_state, cell_index=1, cell_size=10)
+    assert not task._was_canceled()
+    task.cancel()
+    assert task._was_canceled()
+
+
+def test_segment_cell_task_run_calls_state(mock_segmentation_state):
+    task = SegmentCellTask(state=mock_segmentation_state, cell_index=1, cell_size=10)
+    task.run()
+    mock_segmentation_state.segment_cell.assert_called_once()
+    args, kwargs = mock_segmentation_state.segment_cell.call_args
+    assert args == (1, 10)
+    assert callable(kwargs["progress_cb"])
+    assert kwargs["cancel_cb"] == task._was_canceled
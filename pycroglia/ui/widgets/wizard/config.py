@@ -1,4 +1,6 @@
-from typing import Any, List
+import sys
+from types import MappingProxyType
+from typing import Any, List, Mapping
 from PyQt6 import QtCore
 
 from pycroglia.ui.widgets.imagefilters.stacks import FilterEditorStack
@@ -10,41 +12,122 @@ from pycroglia.ui.widgets.wizard.pages import (
     SegmentationEditorPage,
 )
 
-DEFAULT_CONFIG = {
-    # File selection page
-    "file_selection": {
-        "file_headers": ["File Type", "File Path"],
-        "delete_button_text": "Delete",
-        "open_file_text": "Select Files:",
-        "open_button_text": "Open",
-        "open_dialog_title": "Open File",
-        "file_filters": "All Files (*);;Image Files (*.lsm *.tiff *.tif)",
-    },
-    # Filter editor page
-    "filter_editor": {
-        "img_viewer_label": "Image Viewer",
-        "read_button_text": "Load Image",
-        "channels_label": "Channels:",
-        "channel_of_interest_label": "Channel of Interest:",
-        "gray_filter_label": "Gray Filter",
-        "gray_filter_slider_label": "Threshold:",
-        "small_objects_filter_label": "Small Objects Filter",
-        "small_objects_threshold_label": "Min Size:",
+# Static description of each wizard page: widget/page classes, the config
+# section it reads, and how widget arguments map to that section's keys.
+# create_wizard_pages binds a config against this once per page.
+_PAGE_TEMPLATES = [
+    {
+        "section": "file_selection",
+        "widget_class": FileSelectionEditor,
+        "page_class": FileSelectionPage,
+        "arg_keys": {
+            "headers": "file_headers",
+            "delete_button_text": "delete_button_text",
+            "open_file_text": "open_file_text",
+            "open_button_text": "open_button_text",
+            "open_dialog_title": "open_dialog_title",
+            "file_filters": "file_filters",
+        },
+        # Arguments resolved at bind time rather than from the config
+        "extra_args": {"open_dialog_default_path": QtCore.QDir.homePath},
+        "show_back_btn": False,
+        "show_next_btn": True,
     },
-    # Segmentation editor page
-    "segmentation_editor": {
-        "segmentation_headers": ["Cell Number", "Cell Size"],
-        "rollback_button_text": "Roll back segmentation",
-        "segmentation_button_text": "Segment Cell",
-        "progress_title": "Segmenting cell...",
-        "progress_cancel_text": "Cancel",
+    {
+        "section": "filter_editor",
+        "widget_class": FilterEditorStack,
+        "page_class": FilterEditorPage,
+        "arg_keys": {
+            "img_viewer_label": "img_viewer_label",
+            "read_button_text": "read_button_text",
+            "channels_label": "channels_label",
+            "channel_of_interest_label": "channel_of_interest_label",
+            "gray_filter_label": "gray_filter_label",
+            "gray_filter_slider_label": "gray_filter_slider_label",
+            "small_objects_filter_label": "small_objects_filter_label",
+            "small_objects_threshold_label": "small_objects_threshold_label",
+        },
+        "show_back_btn": True,
+        "show_next_btn": True,
     },
-    # Navigation buttons
-    "navigation": {
-        "back_button_text": "Back",
-        "next_button_text": "Next",
+    {
+        "section": "segmentation_editor",
+        "widget_class": SegmentationEditorStack,
+        "page_class": SegmentationEditorPage,
+        "arg_keys": {
+            "headers_text": "segmentation_headers",
+            "rollback_button_text": "rollback_button_text",
+            "segmentation_button_text": "segmentation_button_text",
+            "progress_title": "progress_title",
+            "progress_cancel_text": "progress_cancel_text",
+        },
+        "show_back_btn": True,
+        "show_next_btn": False,
     },
-}
+]
+
+
+def _freeze_config(config: dict[str, Any]) -> Mapping[str, Any]:
+    """Returns a read-only copy of a config with interned leaf strings.
+
+    Args:
+        config (dict[str, Any]): Nested configuration dictionary.
+
+    Returns:
+        Mapping[str, Any]: Read-only view; nested dicts are frozen too.
+    """
+    frozen: dict[str, Any] = {}
+    for key, value in config.items():
+        if isinstance(value, dict):
+            frozen[key] = _freeze_config(value)
+        elif isinstance(value, str):
+            frozen[key] = sys.intern(value)
+        elif isinstance(value, list):
+            frozen[key] = [
+                sys.intern(item) if isinstance(item, str) else item for item in value
+            ]
+        else:
+            frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+DEFAULT_CONFIG = _freeze_config(
+    {
+        # File selection page
+        "file_selection": {
+            "file_headers": ["File Type", "File Path"],
+            "delete_button_text": "Delete",
+            "open_file_text": "Select Files:",
+            "open_button_text": "Open",
+            "open_dialog_title": "Open File",
+            "file_filters": "All Files (*);;Image Files (*.lsm *.tiff *.tif)",
+        },
+        # Filter editor page
+        "filter_editor": {
+            "img_viewer_label": "Image Viewer",
+            "read_button_text": "Load Image",
+            "channels_label": "Channels:",
+            "channel_of_interest_label": "Channel of Interest:",
+            "gray_filter_label": "Gray Filter",
+            "gray_filter_slider_label": "Threshold:",
+            "small_objects_filter_label": "Small Objects Filter",
+            "small_objects_threshold_label": "Min Size:",
+        },
+        # Segmentation editor page
+        "segmentation_editor": {
+            "segmentation_headers": ["Cell Number", "Cell Size"],
+            "rollback_button_text": "Roll back segmentation",
+            "segmentation_button_text": "Segment Cell",
+            "progress_title": "Segmenting cell...",
+            "progress_cancel_text": "Cancel",
+        },
+        # Navigation buttons
+        "navigation": {
+            "back_button_text": "Back",
+            "next_button_text": "Next",
+        },
+    }
+)
 
 
 def create_wizard_pages(config: dict[str, Any]) -> List[dict[str, Any]]:
@@ -66,78 +149,33 @@ def create_wizard_pages(config: dict[str, Any]) -> List[dict[str, Any]]:
             - page_class: Page wrapper class
             - navigation: Navigation button configuration
     """
-    page_configs = [
-        {
-            "type": "file_selection",
-            "widget_class": FileSelectionEditor,
-            "widget_args": {
-                "headers": config["file_selection"]["file_headers"],
-                "delete_button_text": config["file_selection"]["delete_button_text"],
-                "open_file_text": config["file_selection"]["open_file_text"],
-                "open_button_text": config["file_selection"]["open_button_text"],
-                "open_dialog_title": config["file_selection"]["open_dialog_title"],
-                "open_dialog_default_path": QtCore.QDir.homePath(),
-                "file_filters": config["file_selection"]["file_filters"],
-            },
-            "page_class": FileSelectionPage,
-            "navigation": {
-                "show_back_btn": False,
-                "show_next_btn": True,
-                "next_btn_txt": config["navigation"]["next_button_text"],
-            },
-        },
-        {
-            "type": "filter_editor",
-            "widget_class": FilterEditorStack,
-            "widget_args": {
-                "img_viewer_label": config["filter_editor"]["img_viewer_label"],
-                "read_button_text": config["filter_editor"]["read_button_text"],
-                "channels_label": config["filter_editor"]["channels_label"],
-                "channel_of_interest_label": config["filter_editor"][
-                    "channel_of_interest_label"
-                ],
-                "gray_filter_label": config["filter_editor"]["gray_filter_label"],
-                "gray_filter_slider_label": config["filter_editor"][
-                    "gray_filter_slider_label"
-                ],
-                "small_objects_filter_label": config["filter_editor"][
-                    "small_objects_filter_label"
-                ],
-                "small_objects_threshold_label": config["filter_editor"][
-                    "small_objects_threshold_label"
-                ],
-            },
-            "page_class": FilterEditorPage,
-            "navigation": {
-                "show_back_btn": True,
-                "show_next_btn": True,
-                "back_btn_txt": config["navigation"]["back_button_text"],
-                "next_btn_txt": config["navigation"]["next_button_text"],
-            },
-        },
-        {
-            "type": "segmentation_editor",
-            "widget_class": SegmentationEditorStack,
-            "widget_args": {
-                "headers_text": config["segmentation_editor"]["segmentation_headers"],
-                "rollback_button_text": config["segmentation_editor"][
-                    "rollback_button_text"
-                ],
-                "segmentation_button_text": config["segmentation_editor"][
-                    "segmentation_button_text"
-                ],
-                "progress_title": config["segmentation_editor"]["progress_title"],
-                "progress_cancel_text": config["segmentation_editor"][
-                    "progress_cancel_text"
-                ],
-            },
-            "page_class": SegmentationEditorPage,
-            "navigation": {
-                "show_back_btn": True,
-                "show_next_btn": False,
-                "back_btn_txt": config["navigation"]["back_button_text"],
-            },
-        },
-    ]
+    navigation = config["navigation"]
+
+    page_configs = []
+    for template in _PAGE_TEMPLATES:
+        section = config[template["section"]]
+
+        widget_args = {arg: section[key] for arg, key in template["arg_keys"].items()}
+        for arg, resolve in template.get("extra_args", {}).items():
+            widget_args[arg] = resolve()
+
+        page_navigation = {
+            "show_back_btn": template["show_back_btn"],
+            "show_next_btn": template["show_next_btn"],
+        }
+        if template["show_back_btn"]:
+            page_navigation["back_btn_txt"] = navigation["back_button_text"]
+        if template["show_next_btn"]:
+            page_navigation["next_btn_txt"] = navigation["next_button_text"]
+
+        page_configs.append(
+            {
+                "type": template["section"],
+                "widget_class": template["widget_class"],
+                "widget_args": widget_args,
+                "page_class": template["page_class"],
+                "navigation": page_navigation,
+            }
+        )
 
     return page_configs
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any, List
+from functools import partial
+from typing import Callable, Optional, Any, List
 
 from PyQt6 import QtCore, QtWidgets
 
@@ -119,9 +120,9 @@ class FilterEditorPage(BasePage):
             Optional[dict[str, Any]]: Dictionary with 'results' key containing
                 list of filter result dictionaries.
         """
-        list_of_results = self.main_widget.get_results()
-        list_of_dicts = [result.as_dict() for result in list_of_results]
-        return {"results": list_of_dicts}
+        return {
+            "results": [result.as_dict() for result in self.main_widget.get_results()]
+        }
 
     def set_data(self, data: Optional[dict[str, list[str]]]):
         """Set file data to initialize filter editors.
@@ -180,14 +181,16 @@ class SegmentationEditorPage(BasePage):
 class PageManager(QtCore.QObject):
     """Manages wizard page navigation and data flow.
 
-    Handles the creation of pages with navigation buttons and manages
-    the flow of data between pages in the wizard workflow.
+    Pages are registered as factories and built lazily: only the first
+    page is constructed up front, and each following page is built the
+    first time the user navigates to it. Hidden pages therefore cost
+    nothing at wizard startup.
 
     Attributes:
         DEFAULT_BACK_BTN_TXT (str): Default text for back buttons.
         DEFAULT_NEXT_BTN_TXT (str): Default text for next buttons.
         stacked (QtWidgets.QStackedWidget): The stacked widget containing pages.
-        pages (List[BasePage]): List of managed pages.
+        pages (List[Optional[BasePage]]): Built pages, None until first visit.
         current_index (int): Index of the currently displayed page.
     """
 
@@ -208,21 +211,28 @@ class PageManager(QtCore.QObject):
         super().__init__(parent=parent)
 
         self.stacked = stacked_widget
-        self.pages: List[BasePage] = []
+        self.pages: List[Optional[BasePage]] = []
         self.current_index = 0
 
+        self._factories: List[Callable[[], BasePage]] = []
+        self._navigation: List[dict[str, Any]] = []
+
     def add_page(
         self,
-        page: BasePage,
+        page_factory: Callable[[], BasePage],
         show_back_btn: bool = True,
         show_next_btn: bool = True,
         back_btn_txt: Optional[str] = None,
         next_btn_txt: Optional[str] = None,
     ):
-        """Add a page to the wizard with navigation controls.
+        """Register a page factory with navigation controls.
+
+        The first registered page is built immediately since it is the
+        one shown; every other page is built on first navigation.
 
         Args:
-            page (BasePage): The page to add to the wizard.
+            page_factory (Callable[[], BasePage]): Zero-argument factory
+                that builds the page when it is first needed.
             show_back_btn (bool): Whether to show the back button.
             show_next_btn (bool): Whether to show the next button.
             back_btn_txt (Optional[str]): Custom text for back button,
@@ -230,32 +240,68 @@ class PageManager(QtCore.QObject):
             next_btn_txt (Optional[str]): Custom text for next button,
                 uses DEFAULT_NEXT_BTN_TXT if None.
         """
+        self._factories.append(page_factory)
+        self._navigation.append(
+            {
+                "show_back_btn": show_back_btn,
+                "show_next_btn": show_next_btn,
+                "back_btn_txt": back_btn_txt,
+                "next_btn_txt": next_btn_txt,
+            }
+        )
+        self.pages.append(None)
+
+        if len(self.pages) == 1:
+            self._materialize(0)
+
+    def _materialize(self, page_index: int) -> BasePage:
+        """Build the page at the given index if it does not exist yet.
+
+        Pages are only reached through linear navigation, so they
+        materialize in index order and the stacked widget's indices stay
+        aligned with the page list.
+
+        Args:
+            page_index (int): Index of the page to build.
+
+        Returns:
+            BasePage: The built (or previously built) page.
+        """
+        page = self.pages[page_index]
+        if page is not None:
+            return page
+
+        page = self._factories[page_index]()
+        navigation = self._navigation[page_index]
+
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(page.main_widget)
 
-        if show_back_btn or show_next_btn:
+        if navigation["show_back_btn"] or navigation["show_next_btn"]:
             btn_layout = QtWidgets.QHBoxLayout()
-            current_page_index = len(self.pages)
 
-            if show_back_btn:
+            if navigation["show_back_btn"]:
+                back_btn_txt = navigation["back_btn_txt"]
                 back_btn = QtWidgets.QPushButton(
                     back_btn_txt if back_btn_txt else self.DEFAULT_BACK_BTN_TXT
                 )
-                back_btn.clicked.connect(lambda: self._handle_back(current_page_index))
+                back_btn.clicked.connect(partial(self._handle_back, page_index))
                 btn_layout.addWidget(back_btn)
 
-            if show_next_btn:
+            if navigation["show_next_btn"]:
+                next_btn_txt = navigation["next_btn_txt"]
                 next_btn = QtWidgets.QPushButton(
                     next_btn_txt if next_btn_txt else self.DEFAULT_NEXT_BTN_TXT
                 )
-                next_btn.clicked.connect(lambda: self._handle_next(current_page_index))
+                next_btn.clicked.connect(partial(self._handle_next, page_index))
                 btn_layout.addWidget(next_btn)
 
             layout.addLayout(btn_layout)
 
         page.page_widget.setLayout(layout)
-        self.pages.append(page)
+        self.pages[page_index] = page
         self.stacked.addWidget(page.page_widget)
+        return page
 
     def _handle_back(self, page_index: int):
         """Handle back button navigation.
@@ -279,7 +325,7 @@ class PageManager(QtCore.QObject):
         state_of_page = actual_page.get_state()
 
         if page_index + 1 < len(self.pages):
-            next_page = self.pages[page_index + 1]
+            next_page = self._materialize(page_index + 1)
             next_page.set_data(state_of_page)
             self.current_index = page_index + 1
             self.stacked.setCurrentIndex(self.current_index)
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Optional, Any
 from PyQt6 import QtWidgets
 
@@ -46,25 +47,34 @@ class ConfigurableMainStack(QtWidgets.QWidget):
         # Layout
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(self.stacked)
-        self.setLayout(main_layout)
 
     def _create_pages(self):
-        """Create and add all wizard pages using configuration.
+        """Register all wizard pages using configuration.
 
-        Creates pages in the following order:
+        Registers pages in the following order:
         1. File selection page
         2. Filter editor page
         3. Segmentation editor page
 
-        Each page is configured with the appropriate text elements from self.config.
+        Pages are registered as factories; the page manager builds each
+        one the first time the user navigates to it.
         """
         page_configs = create_wizard_pages(self.config)
 
         for page_config in page_configs:
-            widget = page_config["widget_class"](
-                parent=self, **page_config["widget_args"]
+            self.page_manager.add_page(
+                partial(self._build_page, page_config), **page_config["navigation"]
             )
-            page = page_config["page_class"](widget)
 
-            # Add page with navigation
-            self.page_manager.add_page(page, **page_config["navigation"])
+    def _build_page(self, page_config: dict[str, Any]):
+        """Build a page and its main widget from a page configuration.
+
+        Args:
+            page_config (dict[str, Any]): Page configuration from
+                create_wizard_pages.
+
+        Returns:
+            BasePage: The constructed page.
+        """
+        widget = page_config["widget_class"](parent=self, **page_config["widget_args"])
+        return page_config["page_class"](widget)